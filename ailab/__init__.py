@@ -0,0 +1,47 @@
+# AI lab algorithms as an importable package
+# - Importing a module never runs a search or prints; every demo sits under
+#   `if __name__ == "__main__":` and runs with `python -m ailab.<module>`
+# - Submodules load lazily: `import ailab` costs nothing, and `ailab.a_star`
+#   imports ailab/a_star.py on first attribute access
+# - `python -m ailab` is the command-line entry point (see __main__.py)
+
+import importlib
+
+__all__ = [
+    "a_star",
+    "abpruning",
+    "array_tree",
+    "batch_solver",
+    "bdd",
+    "benchmark",
+    "cleanerAgent",
+    "distance_table",
+    "entailment",
+    "forwardchaining",
+    "heuristics",
+    "hill_climbing",
+    "mcts",
+    "open_lists",
+    "puzzle8_dfs",
+    "puzzle8_idfs",
+    "puzzle_state",
+    "resolution",
+    "sat",
+    "search_stats",
+    "selfplay",
+    "solution_cache",
+    "table_files",
+    "tictactoe",
+    "unification",
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,289 @@
+# Command-line entry point: python -m ailab <command> [input] [options]
+# - Input is JSON read from the file named on the command line, or stdin
+#   when it is omitted or "-"
+# - Default output is human readable; --quiet prints one compact JSON object
+#   per result instead (batch prints one per line as boards finish)
+# - --stats adds the search_stats counters to the result
+# - Each command imports only the module it runs
+#
+#   echo '[[1,2,3],[5,0,6],[4,7,8]]' | python -m ailab puzzle --algorithm ida*
+#   python -m ailab batch boards.json --workers 4 --quiet
+#   python -m ailab entails kb.json --truth-table
+#
+# Input formats (lists stand in for the tuples the modules use):
+#   puzzle     [[1,2,3],[4,5,6],[7,0,8]] or {"board": ...}
+#   batch      [board, board, ...]
+#   alphabeta  nested lists with int leaves, or {"tree": ..., "minimizing": true}
+#   entails    {"kb": ["and", "A", ["not", "B"]], "query": "A"}
+#   forward    {"facts": [["Hostile", ["A"]]], "rules": [[[premise, ...], conclusion]],
+#               "query": ["Criminal", ["Robert"]]}
+#   resolve    {"kb": [[["Food", ["x"], false], ["Likes", ["John", "x"], true]], ...],
+#               "query": ["Likes", ["John", "Peanuts"], true]}
+#   unify      {"x": ["f", "x", "B"], "y": ["f", "A", "y"]}
+
+import argparse
+import json
+import math
+import sys
+import time
+
+PUZZLE_ALGORITHMS = ("astar", "bidirectional", "ida*", "iddfs", "dfs", "hill", "local")
+OPTIMAL_ALGORITHMS = ("astar", "bidirectional", "ida*", "iddfs")
+
+def read_input(path):
+    if path in (None, "-"):
+        return json.load(sys.stdin)
+    with open(path) as f:
+        return json.load(f)
+
+def as_tuples(value):
+    """Lists (JSON arrays) to tuples, recursively, for the tuple-based modules."""
+    if isinstance(value, list):
+        return tuple(as_tuples(v) for v in value)
+    return value
+
+def emit(args, result, text_lines):
+    if args.quiet:
+        print(json.dumps(result, separators=(",", ":")))
+    else:
+        for line in text_lines:
+            print(line)
+        if "stats" in result:
+            print("Stats:", ", ".join(f"{k}={v:.4g}" if isinstance(v, float) else f"{k}={v}"
+                                      for k, v in result["stats"].items()))
+
+def new_stats(args):
+    if not args.stats:
+        return None
+    from .search_stats import SearchStats
+    return SearchStats()
+
+def add_stats(result, stats):
+    if stats is not None:
+        result["stats"] = stats.as_dict()
+    return result
+
+# -----------------------------
+# N-puzzle
+# -----------------------------
+def move_names(boards):
+    """Names of the blank's moves along a path of boards."""
+    from .puzzle_state import pack, path_moves
+    return path_moves([pack(b) for b in boards], len(boards[0]))
+
+def solve_puzzle(board, args, stats):
+    """Return the solution as a list of boards, or None."""
+    from .puzzle_state import pack, to_lists, spec
+    width = len(board)
+    if args.algorithm == "astar":
+        from .a_star import a_star
+        return a_star(board, heuristic=args.heuristic, max_nodes=args.max_nodes,
+                      time_limit=args.time_limit, stats=stats)
+    if args.algorithm == "bidirectional":
+        from .a_star import bidirectional_a_star
+        return bidirectional_a_star(board, stats=stats)
+    if args.algorithm in ("ida*", "iddfs"):
+        from .puzzle8_idfs import iterative_deepening
+        path, _ = iterative_deepening(pack(board), spec(width).goal, heuristic=(args.algorithm == "ida*"),
+                                      max_depth=args.depth_limit, width=width, stats=stats)
+    elif args.algorithm == "dfs":
+        from .puzzle8_dfs import dfs_search
+        path, _ = dfs_search(pack(board), spec(width).goal, depth_limit=args.depth_limit,
+                             width=width, stats=stats)
+    elif args.algorithm == "hill":
+        from .hill_climbing import local_search
+        deadline = None if args.time_limit is None else time.monotonic() + args.time_limit
+        path, h = local_search(board, sideways=args.sideways, tabu_size=args.tabu_size,
+                               seed=args.seed, deadline=deadline, stats=stats)
+        return path if h == 0 else None
+    else:
+        from .hill_climbing import random_restart
+        path, h = random_restart(board, restarts=args.restarts, workers=args.workers,
+                                 time_limit=args.time_limit, seed=args.seed,
+                                 sideways=args.sideways, tabu_size=args.tabu_size)
+        return path if h == 0 else None
+    return None if path is None else [to_lists(state, width) for state in path]
+
+def cmd_puzzle(args):
+    data = read_input(args.input)
+    board = data["board"] if isinstance(data, dict) else data
+    from .puzzle_state import is_solvable
+    if not is_solvable(board):
+        emit(args, {"solvable": False, "solved": False}, ["Unsolvable puzzle: the goal cannot be reached."])
+        return 1
+    stats = new_stats(args)
+    if args.cache:
+        if args.algorithm not in OPTIMAL_ALGORITHMS:
+            raise ValueError("The solution cache only stores optimal solutions", args.algorithm)
+        from .solution_cache import SolutionCache, cached_solve
+        with SolutionCache(path=args.cache, width=len(board)) as cache:
+            path = cached_solve(board, cache, lambda b: solve_puzzle(b, args, stats))
+    else:
+        path = solve_puzzle(board, args, stats)
+    if path is None:
+        emit(args, add_stats({"solvable": True, "solved": False}, stats),
+             ["No solution found within the limits."])
+        return 1
+    moves = move_names(path)
+    result = add_stats({"solvable": True, "solved": True, "length": len(moves),
+                        "moves": moves, "path": path}, stats)
+    lines = [f"Solved in {len(moves)} moves: {' '.join(moves)}"]
+    if args.show_path:
+        lines += [" ".join(map(str, row)) + ("\n" if i == len(b) - 1 else "")
+                  for b in path for i, row in enumerate(b)]
+    emit(args, result, lines)
+    return 0
+
+def cmd_batch(args):
+    from .batch_solver import solve_many, SOLVED
+    boards = read_input(args.input)
+    failures = 0
+    for index, status, path, elapsed in solve_many(boards, workers=args.workers, heuristic=args.heuristic,
+                                                   max_nodes=args.max_nodes, time_limit=args.time_limit):
+        result = {"index": index, "status": status, "elapsed": elapsed}
+        if path is not None:
+            result["moves"] = move_names(path)
+            result["length"] = len(path) - 1
+        failures += status != SOLVED
+        emit(args, result, [f"#{index}: {status}" + (f", {len(path) - 1} moves" if path else "")
+                            + f" ({elapsed:.3f}s)"])
+    return 1 if failures else 0
+
+# -----------------------------
+# Games and logic
+# -----------------------------
+def cmd_alphabeta(args):
+    from . import abpruning
+    data = read_input(args.input)
+    tree, maximizing = data, True
+    if isinstance(data, dict):
+        tree, maximizing = data["tree"], not data.get("minimizing", False)
+    stats = new_stats(args)
+    if args.mode == "plain":
+        value, path, pruned = abpruning.alpha_beta(tree, 0, -math.inf, math.inf, maximizing, stats=stats)
+    else:
+        pruned = []
+        trace = (lambda who, depth, rest: pruned.append((who, depth, rest))) if args.prunes else None
+        search = abpruning.fast_alpha_beta if args.mode == "fast" else abpruning.iterative_alpha_beta
+        value, path = search(tree, maximizing, trace=trace, stats=stats)
+    result = add_stats({"value": value, "path": path,
+                        "pruned": [[who, depth, rest] for who, depth, rest in pruned]}, stats)
+    emit(args, result, [f"Root value: {value}", f"Path (indices at each level): {path}",
+                        f"Pruned events: {len(pruned)}"] + [f"  {e}" for e in pruned])
+    return 0
+
+def cmd_entails(args):
+    from .entailment import tt_entails, print_truth_table
+    data = read_input(args.input)
+    kb, query = as_tuples(data["kb"]), as_tuples(data["query"])
+    if args.truth_table and not args.quiet:
+        print_truth_table(kb, query)
+    stats = new_stats(args)
+    entailed = tt_entails(kb, query, stats=stats, backend=args.backend)
+    emit(args, add_stats({"entails": entailed}, stats), [f"KB entails query: {entailed}"])
+    return 0
+
+def cmd_forward(args):
+    from .forwardchaining import forward_chain, format_atom
+    data = read_input(args.input)
+    facts = {as_tuples(f) for f in data["facts"]}
+    rules = [([as_tuples(p) for p in premises], as_tuples(conclusion))
+             for premises, conclusion in data["rules"]]
+    query = as_tuples(data["query"]) if data.get("query") else None
+    stats = new_stats(args)
+    derived, proved = forward_chain(facts, rules, query=query, verbose=args.verbose and not args.quiet,
+                                    stats=stats)
+    derived = sorted(derived)
+    result = add_stats({"proved": proved, "derived": [[p, list(a)] for p, a in derived]}, stats)
+    emit(args, result, ["Derived facts:"] + [f"  {format_atom(f)}" for f in derived]
+         + [f"Result: {'TRUE' if proved else 'FALSE'}"])
+    return 0
+
+def cmd_resolve(args):
+    from .resolution import resolution
+    data = read_input(args.input)
+    kb = [frozenset(as_tuples(lit) for lit in clause) for clause in data["kb"]]
+    query = as_tuples(data["query"])
+    stats = new_stats(args)
+    proved = resolution(kb, query, stats=stats)
+    emit(args, add_stats({"proved": proved}, stats), [f"Result: {proved}"])
+    return 0
+
+def cmd_unify(args):
+    from .unification import unify
+    data = read_input(args.input)
+    subst = unify(data["x"], data["y"])
+    emit(args, {"unifiable": subst is not None, "substitution": subst},
+         [f"Unify {data['x']} with {data['y']} => {subst}"])
+    return 0
+
+# -----------------------------
+# Argument parsing
+# -----------------------------
+def build_parser():
+    from .entailment import BACKENDS  # stdlib-only and cheap to import
+    parser = argparse.ArgumentParser(prog="python -m ailab", description="Run the AI lab algorithms.")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("input", nargs="?", default="-", help="JSON input file (default: stdin)")
+    common.add_argument("-q", "--quiet", action="store_true", help="print compact JSON only")
+    common.add_argument("--stats", action="store_true", help="include search statistics")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    limits = argparse.ArgumentParser(add_help=False)
+    limits.add_argument("--heuristic", default="manhattan", help="manhattan, linear_conflict or pdb")
+    limits.add_argument("--max-nodes", type=int)
+    limits.add_argument("--time-limit", type=float, help="seconds")
+
+    p = commands.add_parser("puzzle", parents=[common, limits], help="solve one N-puzzle board")
+    p.add_argument("--algorithm", choices=PUZZLE_ALGORITHMS, default="astar")
+    p.add_argument("--depth-limit", type=int, help="for dfs, ida* and iddfs")
+    p.add_argument("--sideways", type=int, default=20, help="for hill and local")
+    p.add_argument("--tabu-size", type=int, default=50, help="for hill and local")
+    p.add_argument("--restarts", type=int, default=16, help="for local")
+    p.add_argument("--workers", type=int, help="for local (0 = no process pool)")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--show-path", action="store_true", help="print every board on the path")
+    p.add_argument("--cache", metavar="FILE",
+                   help="sqlite solution cache to read and fill (optimal algorithms only)")
+    p.set_defaults(run=cmd_puzzle)
+
+    p = commands.add_parser("batch", parents=[common, limits], help="solve a list of boards with A*")
+    p.add_argument("--workers", type=int, help="worker processes (0 = in-process)")
+    p.set_defaults(run=cmd_batch)
+
+    p = commands.add_parser("alphabeta", parents=[common], help="alpha-beta over a nested-list tree")
+    p.add_argument("--mode", choices=("plain", "fast", "iterative"), default="plain",
+                   help="fast: PV table, no prune lists; iterative: adds deepening and move ordering")
+    p.add_argument("--prunes", action="store_true", help="record prune events in fast/iterative mode")
+    p.set_defaults(run=cmd_alphabeta)
+
+    p = commands.add_parser("entails", parents=[common], help="propositional entailment check")
+    p.add_argument("--truth-table", action="store_true", help="print the full truth table first")
+    p.add_argument("--backend", choices=BACKENDS, default="bits", help="bits (bit-parallel blocks), models (one model at a time) or sat (CDCL on KB and not query)")
+    p.set_defaults(run=cmd_entails)
+
+    p = commands.add_parser("forward", parents=[common], help="forward chaining over facts and rules")
+    p.add_argument("--verbose", action="store_true", help="print each rule application")
+    p.set_defaults(run=cmd_forward)
+
+    p = commands.add_parser("resolve", parents=[common], help="resolution refutation proof")
+    p.set_defaults(run=cmd_resolve)
+
+    p = commands.add_parser("unify", parents=[common], help="unify two terms")
+    p.set_defaults(run=cmd_unify)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.run(args)
+    except (ValueError, KeyError, TypeError) as e:
+        if args.quiet:
+            print(json.dumps({"error": repr(e)}))
+        else:
+            print("Error:", e, file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
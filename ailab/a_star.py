@@ -0,0 +1,443 @@
+import heapq
+import math
+import time
+
+from .puzzle_state import (spec, pack, to_lists, neighbors, check_solvable,
+                          manhattan_table, manhattan as packed_manhattan)
+from .heuristics import get_heuristic
+from .open_lists import make_open_list, HeapQueue
+from .search_stats import CLOCK_CHECK_INTERVAL, SearchStats
+
+# Goal state (3x3; larger boards use puzzle_state.standard_goal(width))
+goal_state = [[1, 2, 3],
+              [4, 5, 6],
+              [7, 8, 0]]   # 0 = blank
+
+# Manhattan distance heuristic (accepts a board or a packed int state)
+def manhattan(state, width=3):
+    if not isinstance(state, int):
+        width = len(state)
+        state = pack(state)
+    return packed_manhattan(state, width=width)
+
+# Generate neighbors (packed int states, see puzzle_state.py)
+def get_neighbors(state, width=3):
+    return [neighbor for _, neighbor in neighbors(state, width)]
+
+# Print board
+def print_state(state, width=3):
+    if isinstance(state, int):
+        state = to_lists(state, width)
+    for row in state:
+        print(row)
+    print()
+
+# Neighbors with their heuristic values, updated from the moved tile
+def scored_neighbors(state, h, h_fn, s):
+    blank = state >> s.blank_shift
+    result = []
+    for _, target, shift, spread, blank_xor in s.move_table[blank]:
+        tile = (state >> shift) & s.tile_mask
+        neighbor = state ^ (tile * spread) ^ blank_xor
+        result.append((neighbor, h_fn.update(h, state, neighbor, tile, target, blank)))
+    return result
+
+# Reconstruct path from goal back to start
+def reconstruct_path(parents, node, width=3):
+    path = []
+    while node is not None:
+        path.append(to_lists(node, width))
+        node = parents.get(node)
+    return path[::-1]  # reverse
+
+# A* algorithm
+# start_state: a 3x3, 4x4 or 5x5 board; unsolvable boards raise ValueError up front
+# heuristic: a name from heuristics.HEURISTICS ('manhattan', 'linear_conflict',
+# 'pdb') or any object with __call__(state) and update(...) (see heuristics.py)
+# queue: 'heap' or 'bucket' (see open_lists.py). Duplicate entries are not
+# removed from the open list; an entry whose g is worse than the best known g
+# for its state is skipped when popped.
+# max_nodes / time_limit (seconds): give up and return None once that many
+# states have been expanded or that much time has passed.
+# stats: optional search_stats.SearchStats; its tracer receives an "expand"
+# event per expanded state and a "goal" event (see print_expansion below)
+def a_star(start_state, heuristic="manhattan", queue="heap",
+           max_nodes=None, time_limit=None, stats=None):
+    check_solvable(start_state)
+    width = len(start_state)
+    s = spec(width)
+    goal, move_table = s.goal, s.move_table
+    blank_shift, tile_mask = s.blank_shift, s.tile_mask
+    h_fn = get_heuristic(heuristic, width)
+    start = pack(start_state)
+    open_list = make_open_list(queue)
+    open_list.push(h_fn(start), 0, start)  # (f, g, state)
+
+    parents = {start: None}
+    g_score = {start: 0}
+    deadline = None if time_limit is None else time.monotonic() + time_limit
+    expanded = 0
+    if stats is not None:
+        stats.start()
+
+    while open_list:
+        f, g, current = open_list.pop()
+        if g > g_score[current]:
+            continue  # stale entry, a cheaper path was pushed later
+        h = f - g
+
+        if stats is not None:
+            stats.open_size(len(open_list) + 1)
+            stats.closed_size(len(g_score))
+            if stats.tracer is not None:
+                stats.trace("expand", state=to_lists(current, width), g=g, h=h, f=f)
+
+        if current == goal:
+            if stats is not None:
+                stats.stop()
+                stats.trace("goal", state=to_lists(current, width), g=g)
+            return reconstruct_path(parents, current, width)
+
+        expanded += 1
+        if max_nodes is not None and expanded > max_nodes:
+            break
+        if deadline is not None and expanded % CLOCK_CHECK_INTERVAL == 0 and time.monotonic() > deadline:
+            break
+        if stats is not None:
+            stats.expanded += 1
+
+        blank = current >> blank_shift
+        for _, target, shift, spread, blank_xor in move_table[blank]:
+            tile = (current >> shift) & tile_mask
+            neighbor = current ^ (tile * spread) ^ blank_xor
+            tentative_g = g + 1
+
+            if neighbor not in g_score or tentative_g < g_score[neighbor]:
+                parents[neighbor] = current
+                g_score[neighbor] = tentative_g
+                # the tile at target slides into the blank's cell
+                neighbor_h = h_fn.update(h, current, neighbor, tile, target, blank)
+                open_list.push(tentative_g + neighbor_h, tentative_g, neighbor)
+                if stats is not None:
+                    stats.generated += 1
+
+    if stats is not None:
+        stats.stop()
+    return None  # No solution found or budget exhausted
+
+# Tracer reproducing the old per-expansion printout:
+#   a_star(board, stats=SearchStats(tracer=print_expansion))
+def print_expansion(event, data):
+    if event == "expand":
+        print(f"Expanding state with g={data['g']}, h={data['h']}, f={data['f']}")
+        print_state(data["state"])
+    elif event == "goal":
+        print("Reached goal!")
+
+
+# -----------------------------
+# Bidirectional search
+# -----------------------------
+# Join the forward tree (start -> meet) and the backward tree (meet -> goal)
+def join_paths(parents_f, parents_b, meet, width=3):
+    path = reconstruct_path(parents_f, meet, width)
+    node = parents_b[meet]
+    while node is not None:
+        path.append(to_lists(node, width))
+        node = parents_b[node]
+    return path
+
+# Bidirectional breadth-first search: grow whichever frontier is smaller by one
+# full layer. Every meeting found in that layer is a candidate; the shortest
+# one is optimal because both sides are complete up to their current depths.
+def bidirectional_bfs(start_state, stats=None):
+    check_solvable(start_state)
+    width = len(start_state)
+    start, goal = pack(start_state), spec(width).goal
+    if stats is not None:
+        stats.start()
+    try:
+        return _bidirectional_bfs(start, goal, width, stats)
+    finally:
+        if stats is not None:
+            stats.stop()
+
+def _bidirectional_bfs(start, goal, width, stats):
+    parents = [{start: None}, {goal: None}]
+    depth = [{start: 0}, {goal: 0}]
+    frontiers = [[start], [goal]]
+    if start == goal:
+        return join_paths(parents[0], parents[1], start, width)
+
+    while frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        mine, other = depth[side], depth[1 - side]
+        best, meet = math.inf, None
+        next_frontier = []
+        if stats is not None:
+            stats.expanded += len(frontiers[side])
+            stats.open_size(len(frontiers[0]) + len(frontiers[1]))
+            stats.closed_size(len(depth[0]) + len(depth[1]))
+        for state in frontiers[side]:
+            d = mine[state] + 1
+            for neighbor in get_neighbors(state, width):
+                if neighbor in mine:
+                    continue
+                mine[neighbor] = d
+                parents[side][neighbor] = state
+                next_frontier.append(neighbor)
+                if stats is not None:
+                    stats.generated += 1
+                if neighbor in other and d + other[neighbor] < best:
+                    best, meet = d + other[neighbor], neighbor
+        if meet is not None:
+            return join_paths(parents[0], parents[1], meet, width)
+        frontiers[side] = next_frontier
+
+    return None  # No solution found
+
+# Bidirectional A* (front-to-end): the forward search uses Manhattan distance to
+# the goal, the backward search Manhattan distance to the start board. Each
+# step expands the side with the smaller open list; best tracks the shortest
+# start-goal path seen through any meeting state. Once best <= max(min f
+# forward, min f backward) no unexpanded path can be shorter, so we stop.
+def bidirectional_a_star(start_state, stats=None):
+    check_solvable(start_state)
+    width = len(start_state)
+    s = spec(width)
+    move_table, blank_shift, tile_mask = s.move_table, s.blank_shift, s.tile_mask
+    start, goal = pack(start_state), s.goal
+
+    tables = (s.manhattan, manhattan_table(start_state))
+    opens = (HeapQueue(), HeapQueue())
+    g_score = ({start: 0}, {goal: 0})
+    parents = ({start: None}, {goal: None})
+    opens[0].push(packed_manhattan(start, tables[0], width), 0, start)
+    opens[1].push(packed_manhattan(goal, tables[1], width), 0, goal)
+    best, meet = (0, start) if start == goal else (math.inf, None)
+    if stats is not None:
+        stats.start()
+
+    while opens[0] and opens[1]:
+        if best <= max(opens[0].top_f(), opens[1].top_f()):
+            break
+        side = 0 if len(opens[0]) <= len(opens[1]) else 1
+        f, g, current = opens[side].pop()
+        mine, other = g_score[side], g_score[1 - side]
+        if g > mine[current]:
+            continue  # stale entry
+        h = f - g
+        table = tables[side]
+        if stats is not None:
+            stats.expanded += 1
+            stats.open_size(len(opens[0]) + len(opens[1]) + 1)
+            stats.closed_size(len(g_score[0]) + len(g_score[1]))
+            if stats.tracer is not None:
+                stats.trace("expand", side="forward" if side == 0 else "backward",
+                            state=to_lists(current, width), g=g, h=h, f=f)
+
+        blank = current >> blank_shift
+        for _, target, shift, spread, blank_xor in move_table[blank]:
+            tile = (current >> shift) & tile_mask
+            neighbor = current ^ (tile * spread) ^ blank_xor
+            tentative_g = g + 1
+            if neighbor not in mine or tentative_g < mine[neighbor]:
+                mine[neighbor] = tentative_g
+                parents[side][neighbor] = current
+                neighbor_h = h - table[tile][target] + table[tile][blank]
+                opens[side].push(tentative_g + neighbor_h, tentative_g, neighbor)
+                if stats is not None:
+                    stats.generated += 1
+                if neighbor in other and tentative_g + other[neighbor] < best:
+                    best, meet = tentative_g + other[neighbor], neighbor
+
+    if stats is not None:
+        stats.stop()
+    if meet is None:
+        return None  # No solution found
+    return join_paths(parents[0], parents[1], meet, width)
+
+
+# -----------------------------
+# Anytime weighted A* and beam search
+# -----------------------------
+# deadline is a time.monotonic() timestamp; None means no time limit.
+# weighted_a_star status values (as in batch_solver, path is None unless solved)
+SOLVED = "solved"
+NO_SOLUTION = "no solution"  # nothing cheaper than bound exists
+TIMED_OUT = "timed out"
+
+def weighted_a_star(start_state, weight=2.0, heuristic="manhattan", bound=math.inf,
+                    deadline=None, stats=None):
+    """
+    A* on f = g + weight*h. Solutions cost at most weight times the optimum.
+    Nodes with g + h >= bound are pruned (they cannot beat an incumbent of
+    that cost). Returns (status, path): (SOLVED, path), (NO_SOLUTION, None)
+    if nothing under bound exists, or (TIMED_OUT, None) if the deadline
+    passed first.
+    """
+    check_solvable(start_state)
+    width = len(start_state)
+    s = spec(width)
+    h_fn = get_heuristic(heuristic, width)
+    start = pack(start_state)
+    h0 = h_fn(start)
+
+    open_list = HeapQueue()
+    open_list.push(weight * h0, 0, start)
+    parents = {start: None}
+    g_score = {start: 0}
+    h_score = {start: h0}
+    if stats is not None:
+        stats.start()
+    try:
+        return _weighted_search(open_list, parents, g_score, h_score, weight, bound,
+                                h_fn, s, deadline, stats)
+    finally:
+        if stats is not None:
+            stats.stop()
+
+def _weighted_search(open_list, parents, g_score, h_score, weight, bound, h_fn, s, deadline, stats):
+    width = s.width
+    expanded = 0
+    while open_list:
+        f, g, current = open_list.pop()
+        if g > g_score[current]:
+            continue  # stale entry
+        if current == s.goal:
+            return SOLVED, reconstruct_path(parents, current, width)
+
+        expanded += 1
+        if deadline is not None and expanded % CLOCK_CHECK_INTERVAL == 0 and time.monotonic() > deadline:
+            return TIMED_OUT, None
+        if stats is not None:
+            stats.expanded += 1
+            stats.open_size(len(open_list) + 1)
+            stats.closed_size(len(g_score))
+            if stats.tracer is not None:
+                stats.trace("expand", state=to_lists(current, width), g=g,
+                            h=h_score[current], f=f, weight=weight)
+
+        for neighbor, neighbor_h in scored_neighbors(current, h_score[current], h_fn, s):
+            tentative_g = g + 1
+            if tentative_g + neighbor_h >= bound:
+                continue
+            if neighbor not in g_score or tentative_g < g_score[neighbor]:
+                parents[neighbor] = current
+                g_score[neighbor] = tentative_g
+                h_score[neighbor] = neighbor_h
+                open_list.push(tentative_g + weight * neighbor_h, tentative_g, neighbor)
+                if stats is not None:
+                    stats.generated += 1
+
+    return NO_SOLUTION, None
+
+def anytime_weighted_a_star(start_state, weights=(5.0, 3.0, 2.0, 1.5, 1.0),
+                            heuristic="manhattan", deadline=None, stats=None):
+    """
+    Restarting weighted A*: run weighted_a_star with each weight in turn, each
+    run bounded by the best solution so far, and yield (weight, path) every
+    time the solution improves. With an admissible heuristic and a final
+    weight of 1 the last path yielded is optimal. Stops early at the deadline.
+    """
+    best_cost = math.inf
+    for weight in weights:
+        if deadline is not None and time.monotonic() > deadline:
+            return
+        status, path = weighted_a_star(start_state, weight, heuristic, best_cost, deadline, stats)
+        if status == TIMED_OUT:
+            return
+        if path is not None and len(path) - 1 < best_cost:
+            best_cost = len(path) - 1
+            if stats is not None:
+                stats.trace("solution", weight=weight, cost=best_cost)
+            yield weight, path
+
+def beam_search(start_state, beam_width=100, heuristic="manhattan", deadline=None, stats=None):
+    """
+    Breadth-first search that keeps only the beam_width lowest-h states of each
+    layer. Memory is O(beam_width * depth); it may miss solutions, in which
+    case (or at the deadline) it returns None.
+    """
+    check_solvable(start_state)
+    width = len(start_state)
+    s = spec(width)
+    h_fn = get_heuristic(heuristic, width)
+    start = pack(start_state)
+
+    if stats is not None:
+        stats.start()
+    try:
+        return _beam(start, h_fn, s, beam_width, deadline, stats)
+    finally:
+        if stats is not None:
+            stats.stop()
+
+def _beam(start, h_fn, s, beam_width, deadline, stats):
+    width = s.width
+    parents = {start: None}
+    layer = [(h_fn(start), start)]
+    while layer:
+        for h, state in layer:
+            if state == s.goal:
+                return reconstruct_path(parents, state, width)
+        if deadline is not None and time.monotonic() > deadline:
+            return None
+
+        candidates = {}
+        if stats is not None:
+            stats.expanded += len(layer)
+            stats.open_size(len(layer))
+            stats.closed_size(len(parents))
+        for h, state in layer:
+            for neighbor, neighbor_h in scored_neighbors(state, h, h_fn, s):
+                if neighbor not in parents and neighbor not in candidates:
+                    candidates[neighbor] = (neighbor_h, state)
+        if stats is not None:
+            stats.generated += len(candidates)
+        kept = heapq.nsmallest(beam_width, candidates.items(), key=lambda item: item[1][0])
+        layer = []
+        for neighbor, (neighbor_h, parent) in kept:
+            parents[neighbor] = parent
+            layer.append((neighbor_h, neighbor))
+
+    return None
+
+def solve_within(start_state, time_limit, heuristic="manhattan", beam_width=100):
+    """
+    Best path found within time_limit seconds: a quick beam search answer
+    first, then anytime weighted A* improvements. Returns None only if
+    neither produced a solution in time.
+    """
+    deadline = time.monotonic() + time_limit
+    best = beam_search(start_state, beam_width, heuristic, deadline)
+    for _, path in anytime_weighted_a_star(start_state, heuristic=heuristic, deadline=deadline):
+        if best is None or len(path) < len(best):
+            best = path
+    return best
+
+
+if __name__ == "__main__":
+    # This textbook start state was written for a different goal layout; against
+    # ours its inversion count is odd, so it is rejected before any search.
+    start_state = [[2, 8, 3],
+                   [1, 6, 4],
+                   [7, 0, 5]]
+    try:
+        a_star(start_state)
+    except ValueError:
+        print("Start state", start_state, "cannot reach the goal; skipped.\n")
+
+    # Example start state
+    start_state = [[1, 2, 3],
+                   [5, 0, 6],
+                   [4, 7, 8]]
+
+    stats = SearchStats(tracer=print_expansion)
+    solution_path = a_star(start_state, stats=stats)
+    print(stats)
+
+    print("\nSolution path:")
+    for step, state in enumerate(solution_path):
+        print(f"Step {step}:")
+        print_state(state)
@@ -0,0 +1,415 @@
+# Minimal Alpha-Beta (simple, modular, trace of pruned branches)
+# - Tree: nested lists; leaves are ints (scores)
+# - Returns best value, best path (list of child indices), and pruned info
+# - Optional stats (search_stats.SearchStats): expanded inner nodes, generated
+#   children visited, cutoffs, deepest ply as peak_open; tracer gets "prune"
+# - game_alpha_beta searches any Game (moves/apply/undo/terminal/evaluate)
+#   with an optional Zobrist-keyed TranspositionTable
+
+import math
+import random
+from typing import Tuple, List, Any, Optional
+
+PruneInfo = Tuple[str, int, List[int]]  # (who, depth, remaining_child_indices)
+
+def alpha_beta(node: Any, depth: int, alpha: float, beta: float,
+               maximizing: bool, stats: Any = None) -> Tuple[float, List[int], List[PruneInfo]]:
+    """
+    Returns (best_value, best_path, pruned_list) for the subtree rooted at node.
+    best_path is a list of indices from this node down to the chosen leaf.
+    pruned_list collects prune events occurring in this subtree (local indexing).
+    """
+    pruned: List[PruneInfo] = []
+
+    # Leaf node
+    if isinstance(node, int):
+        return float(node), [], pruned
+    if stats is not None:
+        stats.expanded += 1
+        stats.open_size(depth + 1)
+
+    if maximizing:
+        best_val = -math.inf
+        best_path: List[int] = []
+        for i, child in enumerate(node):
+            if stats is not None:
+                stats.generated += 1
+            val, path, child_pruned = alpha_beta(child, depth + 1, alpha, beta, False, stats)
+            pruned.extend(child_pruned)
+            if val > best_val:
+                best_val, best_path = val, [i] + path
+            alpha = max(alpha, best_val)
+            if alpha >= beta:  # prune remaining children
+                remaining = list(range(i + 1, len(node)))
+                pruned.append(("MAX", depth, remaining))
+                if stats is not None:
+                    stats.cutoffs += 1
+                    stats.trace("prune", who="MAX", depth=depth, remaining=remaining)
+                break
+        return best_val, best_path, pruned
+    else:  # minimizing
+        best_val = math.inf
+        best_path: List[int] = []
+        for i, child in enumerate(node):
+            if stats is not None:
+                stats.generated += 1
+            val, path, child_pruned = alpha_beta(child, depth + 1, alpha, beta, True, stats)
+            pruned.extend(child_pruned)
+            if val < best_val:
+                best_val, best_path = val, [i] + path
+            beta = min(beta, best_val)
+            if alpha >= beta:
+                remaining = list(range(i + 1, len(node)))
+                pruned.append(("MIN", depth, remaining))
+                if stats is not None:
+                    stats.cutoffs += 1
+                    stats.trace("prune", who="MIN", depth=depth, remaining=remaining)
+                break
+        return best_val, best_path, pruned
+
+
+# -----------------------------
+# Fast search over nested-list trees
+# -----------------------------
+# alpha_beta above builds a pruned list per node and a new path list per
+# improvement. fast_alpha_beta keeps the principal variation in a triangular
+# table allocated once (row p holds the best line from ply p; an improvement at
+# ply p copies row p+1 into it) and only reports prunes to trace(who, depth,
+# remaining) when a trace sink is given. iterative_alpha_beta adds depth-limited
+# iterations with move ordering: the previous PV move first, then two killer
+# moves per ply (children that caused a cutoff at that ply), then the rest by
+# history score (cutoffs weighted by remaining depth).
+class _PVSearch:
+    def __init__(self, trace=None, stats=None, ordered=False, evaluate=None):
+        self.trace = trace
+        self.stats = stats
+        self.ordered = ordered
+        self.evaluate = evaluate or leftmost_leaf
+        self.size = 0
+        self.pv = []
+        self.pv_len = []
+        self.killers = []
+        self.history = []
+        self.prev_pv = []
+        self.horizon = None
+        self.hit_horizon = False
+        self._grow(16)
+
+    def _grow(self, size):
+        old = self.size
+        self.size = size
+        # rows grow in place: callers up the recursion hold references to them
+        for row in self.pv:
+            row.extend([0] * (size - old))
+        self.pv += [[0] * size for _ in range(size - old)]
+        self.pv_len += [0] * (size - old)
+        self.killers += [[-1, -1] for _ in range(size - old)]
+        self.history += [[] for _ in range(size - old)]
+
+    def search(self, node, ply, alpha, beta, maximizing, on_pv):
+        if isinstance(node, int):
+            self.pv_len[ply] = ply
+            return node
+        if ply + 1 >= self.size:
+            self._grow(self.size * 2)
+        if self.horizon is not None and ply >= self.horizon:
+            self.hit_horizon = True
+            self.pv_len[ply] = ply
+            return self.evaluate(node)
+        stats = self.stats
+        if stats is not None:
+            stats.expanded += 1
+            stats.open_size(ply + 1)
+
+        n = len(node)
+        order = range(n) if not self.ordered else self._order(n, ply, on_pv)
+        pv_move = self.prev_pv[ply] if on_pv and ply < len(self.prev_pv) else -1
+        best_val = -math.inf if maximizing else math.inf
+        self.pv_len[ply] = ply
+        row = self.pv[ply]
+        for k, i in enumerate(order):
+            if stats is not None:
+                stats.generated += 1
+            val = self.search(node[i], ply + 1, alpha, beta, not maximizing, i == pv_move)
+            if (val > best_val) if maximizing else (val < best_val):
+                best_val = val
+                # best line from here: this move, then the child's line
+                row[ply] = i
+                child, end = self.pv[ply + 1], self.pv_len[ply + 1]
+                for j in range(ply + 1, end):
+                    row[j] = child[j]
+                self.pv_len[ply] = end
+            if maximizing:
+                if best_val > alpha:
+                    alpha = best_val
+            elif best_val < beta:
+                beta = best_val
+            if alpha >= beta:
+                if stats is not None:
+                    stats.cutoffs += 1
+                if self.trace is not None:
+                    self.trace("MAX" if maximizing else "MIN", ply, [order[j] for j in range(k + 1, n)])
+                if self.ordered:
+                    self._reward(ply, i)
+                break
+        return best_val
+
+    def _order(self, n, ply, on_pv):
+        history = self.history[ply]
+        if len(history) < n:
+            history += [0] * (n - len(history))
+        order = sorted(range(n), key=history.__getitem__, reverse=True)
+        first = [self.prev_pv[ply]] if on_pv and ply < len(self.prev_pv) else []
+        first += [m for m in self.killers[ply] if m >= 0]
+        front = 0
+        for m in first:
+            if m < n and m in order[front:]:
+                order.remove(m)
+                order.insert(front, m)
+                front += 1
+        return order
+
+    def _reward(self, ply, i):
+        killers = self.killers[ply]
+        if killers[0] != i:
+            killers[1] = killers[0]
+            killers[0] = i
+        remaining = (self.horizon - ply) if self.horizon is not None else 1
+        self.history[ply][i] += remaining * remaining
+
+    def principal_variation(self):
+        return self.pv[0][:self.pv_len[0]]
+
+def leftmost_leaf(node: Any) -> Any:
+    """Default horizon estimate for iterative deepening: the first leaf below node."""
+    while not isinstance(node, int):
+        node = node[0]
+    return node
+
+def fast_alpha_beta(tree: Any, maximizing: bool = True, trace: Any = None,
+                    stats: Any = None) -> Tuple[float, List[int]]:
+    """
+    Returns (best_value, best_path) like alpha_beta, without building prune
+    lists or per-node paths. trace(who, depth, remaining) receives each prune.
+    """
+    search = _PVSearch(trace, stats)
+    value = search.search(tree, 0, -math.inf, math.inf, maximizing, False)
+    return value, search.principal_variation()
+
+def iterative_alpha_beta(tree: Any, maximizing: bool = True, max_depth: Optional[int] = None,
+                         evaluate: Any = None, trace: Any = None,
+                         stats: Any = None) -> Tuple[float, List[int]]:
+    """
+    Search depth 1, 2, ... with PV/killer/history move ordering carried
+    between iterations; inner nodes at the depth limit are scored by
+    evaluate(node) (default leftmost_leaf). Stops after max_depth, or once an
+    iteration reaches every leaf, which gives the exact (best_value, best_path).
+    """
+    search = _PVSearch(None, stats, ordered=True, evaluate=evaluate)
+    pruned = []
+    if trace is not None:
+        search.trace = lambda *event: pruned.append(event)
+    depth = 1
+    while True:
+        search.horizon = depth
+        search.hit_horizon = False
+        last = max_depth is not None and depth >= max_depth
+        # only the final iteration reports prunes: whether an iteration is final
+        # is known only once it ends, so its prunes are held until then
+        pruned.clear()
+        value = search.search(tree, 0, -math.inf, math.inf, maximizing, True)
+        search.prev_pv = search.principal_variation()
+        if not search.hit_horizon or last:
+            for event in pruned:
+                trace(*event)
+            return value, search.principal_variation()
+        depth += 1
+
+
+# -----------------------------
+# Game interface
+# -----------------------------
+class Game:
+    """
+    Position that game_alpha_beta can search in place.
+    key: Zobrist hash of the position (side to move included), kept up to date
+         by apply/undo
+    max_to_move: True when the maximizing player moves next
+    evaluate(): score from the maximizing player's point of view
+    """
+    key = 0
+    max_to_move = True
+
+    def moves(self) -> List[Any]:
+        raise NotImplementedError
+
+    def apply(self, move: Any) -> None:
+        raise NotImplementedError
+
+    def undo(self, move: Any) -> None:
+        raise NotImplementedError
+
+    def is_terminal(self) -> bool:
+        raise NotImplementedError
+
+    def evaluate(self) -> float:
+        raise NotImplementedError
+
+def zobrist_keys(count: int, seed: int = 0) -> List[int]:
+    """count random 64-bit keys; XOR one in per (square, piece) and one for the side to move."""
+    rng = random.Random(seed)
+    return [rng.getrandbits(64) for _ in range(count)]
+
+# -----------------------------
+# Transposition table
+# -----------------------------
+EXACT, LOWER, UPPER = 0, 1, 2  # value is exact / a lower bound (fail high) / an upper bound (fail low)
+
+class TranspositionTable:
+    """
+    Fixed number of slots indexed by the low bits of the key; each slot holds
+    (key, depth, bound, value, move, generation). A store replaces the slot's
+    entry if it is for the same position, was searched at least as deep, or
+    is left over from an earlier search (new_search() bumps the generation).
+    """
+
+    def __init__(self, size: int = 1 << 16):
+        if size <= 0 or size & (size - 1):
+            raise ValueError("Table size must be a power of two", size)
+        self.mask = size - 1
+        self.slots: List[Optional[tuple]] = [None] * size
+        self.generation = 0
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+        self.replacements = 0
+
+    def new_search(self) -> None:
+        self.generation += 1
+
+    def probe(self, key: int) -> Optional[tuple]:
+        self.probes += 1
+        entry = self.slots[key & self.mask]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        return None
+
+    def store(self, key: int, depth: int, bound: int, value: float, move: Any) -> None:
+        index = key & self.mask
+        old = self.slots[index]
+        if old is not None and old[0] != key:
+            if old[1] > depth and old[5] == self.generation:
+                return  # keep the deeper entry from this search
+            self.replacements += 1
+        self.slots[index] = (key, depth, bound, value, move, self.generation)
+        self.stores += 1
+
+    def clear(self) -> None:
+        self.slots = [None] * len(self.slots)
+
+def game_alpha_beta(game: Game, depth: int, alpha: float = -math.inf, beta: float = math.inf,
+                    table: Optional[TranspositionTable] = None,
+                    stats: Any = None) -> Tuple[float, Any]:
+    """
+    Returns (value, best_move) for game searched depth plies ahead (best_move
+    is None at terminal or depth-0 positions). The game is modified in place
+    and restored before returning. With a table, stored bounds narrow the
+    window and the stored best move is tried first.
+    """
+    if game.is_terminal() or depth == 0:
+        return game.evaluate(), None
+    if stats is not None:
+        stats.expanded += 1
+
+    alpha0, beta0 = alpha, beta
+    hash_move = None
+    if table is not None:
+        entry = table.probe(game.key)
+        if entry is not None:
+            _, entry_depth, bound, value, hash_move, _ = entry
+            if entry_depth >= depth:
+                if bound == EXACT:
+                    return value, hash_move
+                if bound == LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    if stats is not None:
+                        stats.cutoffs += 1
+                    return value, hash_move
+
+    moves = game.moves()
+    if hash_move is not None and hash_move in moves:
+        moves.remove(hash_move)
+        moves.insert(0, hash_move)
+
+    maximizing = game.max_to_move
+    best_val = -math.inf if maximizing else math.inf
+    best_move = None
+    for move in moves:
+        if stats is not None:
+            stats.generated += 1
+        game.apply(move)
+        val, _ = game_alpha_beta(game, depth - 1, alpha, beta, table, stats)
+        game.undo(move)
+        if maximizing:
+            if val > best_val:
+                best_val, best_move = val, move
+            alpha = max(alpha, best_val)
+        else:
+            if val < best_val:
+                best_val, best_move = val, move
+            beta = min(beta, best_val)
+        if alpha >= beta:
+            if stats is not None:
+                stats.cutoffs += 1
+                stats.trace("prune", who="MAX" if maximizing else "MIN", depth=depth, move=move)
+            break
+
+    if table is not None:
+        if best_val <= alpha0:
+            bound = UPPER
+        elif best_val >= beta0:
+            bound = LOWER
+        else:
+            bound = EXACT
+        table.store(game.key, depth, bound, best_val, best_move)
+    return best_val, best_move
+
+
+tree = [
+    [   # Left subtree (MIN)
+        [21, 5],
+        [15, 11],
+        [12, 8]
+    ],
+    [   # Middle subtree (MIN)
+        [9, 13],
+        [5, 12],
+        [13, 12]
+    ],
+    [   # Right subtree (MIN)
+        [13, 14],
+        [7, 10]
+    ]
+]
+
+if __name__ == "__main__":
+    value, path, pruned_events = alpha_beta(tree, depth=0, alpha=-math.inf, beta=math.inf, maximizing=True)
+    print("Root value:", value)
+    print("Path (indices at each level):", path)   # e.g. [0,1,0] -> root's child 0, then 1, then 0
+    print("Pruned events (who, depth, remaining child indices):")
+    for e in pruned_events:
+        print(" ", e)
+
+    # Tic-tac-toe from the empty board, with and without a transposition table
+    from .search_stats import SearchStats
+    from .tictactoe import TicTacToe
+
+    for table in (None, TranspositionTable()):
+        stats = SearchStats()
+        value, move = game_alpha_beta(TicTacToe(), 9, table=table, stats=stats)
+        label = "with table" if table else "no table"
+        print(f"tic-tac-toe {label:10s}: value {value:+.0f}, first move {move}, {stats.expanded} nodes")
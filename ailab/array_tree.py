@@ -0,0 +1,224 @@
+# Array-backed game trees for alpha-beta (no per-node Python objects)
+# - Nodes are numbered breadth first; the children of node i are nodes
+#   offsets[i] .. offsets[i+1]-1, so a leaf has offsets[i] == offsets[i+1]
+# - values[i] is the score of leaf i (ignored for inner nodes)
+# - File layout: 8-byte magic, node count (int64), offsets (count+1 int64),
+#   values (count int64), native byte order. load() memory-maps the file and
+#   views the arrays in place, so worker processes share the page-cached bytes
+# - parallel_alpha_beta splits the root's children across processes, young
+#   brothers wait style: the eldest child is searched first, then the rest in
+#   parallel, and every worker tightens its window from a shared best-so-far
+#   bound that workers raise as soon as they finish a better child
+
+import math
+import mmap
+import multiprocessing
+import random
+import struct
+from array import array
+from collections import deque
+
+MAGIC = b"ABTREE1\0"
+HEADER = struct.Struct("=8sq")
+ITEM = array("q").itemsize
+
+class ArrayTree:
+    def __init__(self, offsets, values):
+        self.offsets = offsets
+        self.values = values
+
+    def __len__(self):
+        return len(self.values)
+
+    def children(self, node):
+        return range(self.offsets[node], self.offsets[node + 1])
+
+    def save(self, path):
+        count = len(self.values)
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, count))
+            f.write(memoryview(array("q", self.offsets)).cast("B"))
+            f.write(memoryview(array("q", self.values)).cast("B"))
+
+def load(path):
+    """Memory-map a saved tree; offsets and values are int64 views into the file."""
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, count = HEADER.unpack_from(mm)
+    if magic != MAGIC or len(mm) != HEADER.size + (2 * count + 1) * ITEM:
+        raise ValueError("Not an array tree file", path)
+    data = memoryview(mm)[HEADER.size:]
+    split = (count + 1) * ITEM
+    return ArrayTree(data[:split].cast("q"), data[split:].cast("q"))
+
+def from_nested(tree):
+    """Convert an abpruning-style nested-list tree (int leaves)."""
+    offsets, values = array("q"), array("q")
+    queue = deque([tree])
+    next_id = 1
+    while queue:
+        node = queue.popleft()
+        offsets.append(next_id)
+        if isinstance(node, int):
+            values.append(node)
+        else:
+            values.append(0)
+            queue.extend(node)
+            next_id += len(node)
+    offsets.append(next_id)
+    return ArrayTree(offsets, values)
+
+def random_tree(branching, depth, seed=0, low=-100, high=100):
+    """Complete tree with random leaf values, built straight into arrays."""
+    inner = (branching ** depth - 1) // (branching - 1) if branching > 1 else depth
+    count = inner + branching ** depth
+    offsets = array("q", range(1, inner * branching + 1, branching))
+    offsets.extend([count] * (count - inner + 1))
+    rng = random.Random(seed)
+    values = array("q", bytes(inner * ITEM))
+    values.extend(rng.randint(low, high) for _ in range(count - inner))
+    return ArrayTree(offsets, values)
+
+# -----------------------------
+# Search
+# -----------------------------
+# bound: optional shared best-so-far value for the root (a RawValue), read
+# every 256 nodes to raise alpha (MAX root) or lower beta (MIN root)
+class _Search:
+    def __init__(self, tree, stats=None, bound=None, root_max=True):
+        self.offsets, self.values = tree.offsets, tree.values
+        self.stats = stats
+        self.bound = bound
+        self.root_max = root_max
+        self.nodes = 0
+        self.pv = [[0] * 16 for _ in range(16)]
+        self.pv_len = [0] * 16
+
+    def search(self, node, ply, alpha, beta, maximizing):
+        start, end = self.offsets[node], self.offsets[node + 1]
+        if start == end:
+            self.pv_len[ply] = ply
+            return self.values[node]
+        if ply + 1 >= len(self.pv_len):
+            size = 2 * len(self.pv_len)
+            for row in self.pv:
+                row.extend([0] * (size - len(row)))
+            self.pv += [[0] * size for _ in range(size - len(self.pv))]
+            self.pv_len += [0] * (size - len(self.pv_len))
+        self.nodes += 1
+        if self.bound is not None and self.nodes & 255 == 0:
+            shared = self.bound.value
+            if self.root_max:
+                alpha = max(alpha, shared)
+            else:
+                beta = min(beta, shared)
+        stats = self.stats
+        if stats is not None:
+            stats.expanded += 1
+            stats.open_size(ply + 1)
+
+        best_val = -math.inf if maximizing else math.inf
+        self.pv_len[ply] = ply
+        row = self.pv[ply]
+        for child in range(start, end):
+            if stats is not None:
+                stats.generated += 1
+            val = self.search(child, ply + 1, alpha, beta, not maximizing)
+            if (val > best_val) if maximizing else (val < best_val):
+                best_val = val
+                row[ply] = child - start
+                child_row, child_end = self.pv[ply + 1], self.pv_len[ply + 1]
+                for j in range(ply + 1, child_end):
+                    row[j] = child_row[j]
+                self.pv_len[ply] = child_end
+            if maximizing:
+                if best_val > alpha:
+                    alpha = best_val
+            elif best_val < beta:
+                beta = best_val
+            if alpha >= beta:
+                if stats is not None:
+                    stats.cutoffs += 1
+                break
+        return best_val
+
+    def principal_variation(self, ply=0):
+        return self.pv[ply][ply:self.pv_len[ply]]
+
+def array_alpha_beta(tree, maximizing=True, node=0, stats=None):
+    """Returns (best_value, best_path) for the subtree at node, like abpruning.alpha_beta."""
+    search = _Search(tree, stats)
+    value = search.search(node, 0, -math.inf, math.inf, maximizing)
+    return value, search.principal_variation()
+
+# -----------------------------
+# Parallel root splitting
+# -----------------------------
+_worker = {}
+
+def _init_worker(path, bound, lock, root_max):
+    _worker.update(tree=load(path), bound=bound, lock=lock, root_max=root_max)
+
+def _search_child(task):
+    index, child = task
+    tree, bound, lock, root_max = _worker["tree"], _worker["bound"], _worker["lock"], _worker["root_max"]
+    search = _Search(tree, bound=bound, root_max=root_max)
+    shared = bound.value
+    alpha, beta = (shared, math.inf) if root_max else (-math.inf, shared)
+    value = search.search(child, 0, alpha, beta, not root_max)
+    # only a value strictly better than every bound used is exact
+    with lock:
+        better = value > bound.value if root_max else value < bound.value
+        if better:
+            bound.value = value
+    return index, value, better, search.principal_variation(), search.nodes
+
+def parallel_alpha_beta(path, maximizing=True, workers=None):
+    """
+    Search the tree saved at path with the root's children split across
+    worker processes. Returns (best_value, best_path, nodes_expanded).
+    """
+    tree = load(path)
+    children = tree.children(0)
+    if not children:
+        return tree.values[0], [], 0
+    # eldest brother first, in this process, to seed the shared bound
+    search = _Search(tree)
+    best_value = search.search(children[0], 0, -math.inf, math.inf, not maximizing)
+    best_path = [0] + search.principal_variation()
+    nodes = 1 + search.nodes
+
+    bound = multiprocessing.RawValue("d", best_value)
+    lock = multiprocessing.Lock()
+    tasks = [(i, child) for i, child in enumerate(children) if i > 0]
+    with multiprocessing.Pool(workers, initializer=_init_worker,
+                              initargs=(path, bound, lock, maximizing)) as pool:
+        for index, value, better, pv, expanded in pool.imap_unordered(_search_child, tasks):
+            nodes += expanded
+            if better and ((value > best_value) if maximizing else (value < best_value)):
+                best_value, best_path = value, [index] + pv
+    return best_value, best_path, nodes
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+
+    from .abpruning import alpha_beta, tree as example
+
+    small = from_nested(example)
+    print("example tree:", array_alpha_beta(small), "nested:", alpha_beta(example, 0, -math.inf, math.inf, True)[:2])
+
+    path = os.path.join(tempfile.mkdtemp(), "tree.bin")
+    started = time.perf_counter()
+    random_tree(12, 6, seed=1).save(path)  # 3.0M leaves, 48 MB on disk
+    print(f"built and saved 12^6 tree in {time.perf_counter() - started:.1f} s")
+
+    big = load(path)
+    started = time.perf_counter()
+    value, best = array_alpha_beta(big)
+    print(f"serial:   value {value} path {best} in {time.perf_counter() - started:.2f} s")
+    started = time.perf_counter()
+    value, best, nodes = parallel_alpha_beta(path)
+    print(f"parallel: value {value} path {best} in {time.perf_counter() - started:.2f} s ({nodes} nodes)")
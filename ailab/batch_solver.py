@@ -0,0 +1,84 @@
+# Batch solving of many N-puzzle boards on a process pool
+# - solve_many() is a generator: results come back as workers finish them,
+#   tagged with the input index, so callers can stream them out
+# - Each task carries only (index, board). The search settings are handed to
+#   every worker once by the pool initializer, and heuristic tables are loaded
+#   once per worker (pattern databases are mmap'd files, so all workers share
+#   the same page-cached bytes instead of receiving pickled copies)
+# - Per-instance budgets: max_nodes expansions and time_limit seconds
+
+import multiprocessing
+import time
+
+from .a_star import a_star
+from .heuristics import get_heuristic
+from .puzzle_state import is_solvable
+
+# Result status values
+SOLVED = "solved"
+UNSOLVABLE = "unsolvable"
+BUDGET = "budget"  # max_nodes or time_limit ran out first
+
+_settings = {}
+
+def _init_worker(settings):
+    _settings.update(settings)
+
+def solve_one(index, board, heuristic="manhattan", queue="heap", max_nodes=None, time_limit=None):
+    """Return (index, status, path, elapsed_seconds); path is None unless solved."""
+    started = time.perf_counter()
+    if not is_solvable(board):
+        return index, UNSOLVABLE, None, time.perf_counter() - started
+    path = a_star(board, heuristic, queue, max_nodes=max_nodes, time_limit=time_limit)
+    status = SOLVED if path is not None else BUDGET
+    return index, status, path, time.perf_counter() - started
+
+def _solve_task(task):
+    index, board = task
+    return solve_one(index, board, **_settings)
+
+def solve_many(states, workers=None, heuristic="manhattan", queue="heap",
+               max_nodes=None, time_limit=None):
+    """
+    Solve every board in states, yielding (index, status, path, elapsed) in
+    completion order. workers=None uses every core; workers=0 solves in this
+    process (no pool). heuristic must be a name from heuristics.HEURISTICS
+    when a pool is used, since workers load their own copy of the tables.
+    """
+    states = [[list(row) for row in board] for board in states]
+    settings = dict(heuristic=heuristic, queue=queue, max_nodes=max_nodes, time_limit=time_limit)
+
+    if workers == 0:
+        for index, board in enumerate(states):
+            yield solve_one(index, board, **settings)
+        return
+
+    if not isinstance(heuristic, str):
+        raise ValueError("Pass the heuristic by name when using worker processes", heuristic)
+    # build any missing table files here, so workers only ever map finished files
+    for width in {len(board) for board in states}:
+        get_heuristic(heuristic, width)
+
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(settings,)) as pool:
+        yield from pool.imap_unordered(_solve_task, enumerate(states))
+
+
+if __name__ == "__main__":
+    import random
+
+    from .puzzle_state import standard_goal
+
+    random.seed(0)
+    boards = []
+    for _ in range(40):
+        tiles = [v for row in standard_goal(3) for v in row]
+        random.shuffle(tiles)
+        boards.append([tiles[r * 3:(r + 1) * 3] for r in range(3)])
+
+    started = time.perf_counter()
+    counts = {}
+    for index, status, path, elapsed in solve_many(boards, heuristic="pdb", max_nodes=100000):
+        counts[status] = counts.get(status, 0) + 1
+        moves = len(path) - 1 if path else "-"
+        print(f"board {index:2d}: {status:10s} moves={moves} ({elapsed * 1000:.1f} ms)")
+    print(f"\n{counts} in {time.perf_counter() - started:.2f} s")
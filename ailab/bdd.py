@@ -0,0 +1,394 @@
+# Compiled knowledge bases: a KB as a reduced ordered BDD (binary decision
+# diagram), compiled once and queried many times
+# - Nodes live in flat lists (level, low, high) indexed by node id; 0 and 1
+#   are the FALSE and TRUE terminals. A unique table maps (level, low, high)
+#   to its node, so equal subfunctions are one node and two formulas are
+#   equivalent iff they compile to the same id
+# - All operations go through ite(f, g, h) = (f ∧ g) ∨ (¬f ∧ h), memoized in
+#   an operation cache (cleared when it passes cache_limit entries), so
+#   queries sharing subformulas with earlier queries reuse their work. ite
+#   and build use explicit stacks, so neither the number of symbols nor the
+#   nesting depth of an expression is limited by Python's recursion limit
+# - Query nodes stay in the tables after the query. Once more than
+#   query_nodes of them pile up, the BDD is cut back to the KB's own nodes
+#   and symbols (and the cache cleared), so a long-running worker stays
+#   bounded in memory
+# - Variable order: the KB's symbols in order of first appearance unless an
+#   order is given; query symbols the KB lacks are appended below them
+# - KB ⊨ q iff KB → q compiles to TRUE; a path to FALSE in KB → q is a
+#   counter-model. Model counts and counter-models need no enumeration
+# - Children always get smaller ids than their parents, so increasing id
+#   order is a bottom-up order (used by count_models and save)
+# - File layout: 8-byte magic, symbol count, node count, root, symbol JSON
+#   length (int64 each), the symbols as a JSON list, then the level, low and
+#   high arrays (int32, native byte order) of the nodes reachable from the KB
+#
+#   kb = compile_kb(KB); kb.save("kb.bdd")
+#   worker: kb = load("kb.bdd"); kb.entails_all(queries)
+
+import json
+import multiprocessing
+import struct
+from array import array
+
+FALSE, TRUE = 0, 1
+TERMINAL = 1 << 30  # level of the terminals, below every variable
+MAGIC = b"KBBDD1\0\0"
+HEADER = struct.Struct("=8sqqqq")
+
+class BDD:
+    def __init__(self, order=(), cache_limit=1 << 20):
+        self.level = [TERMINAL, TERMINAL]
+        self.low = [FALSE, TRUE]
+        self.high = [FALSE, TRUE]
+        self.unique = {}
+        self.cache = {}
+        self.cache_limit = cache_limit
+        self.order = []   # level -> symbol
+        self.levels = {}  # symbol -> level
+        for symbol in order:
+            self.add_symbol(symbol)
+
+    def __len__(self):
+        return len(self.level)
+
+    def add_symbol(self, symbol):
+        """Level of symbol, appending it at the bottom of the order if new."""
+        level = self.levels.get(symbol)
+        if level is None:
+            level = self.levels[symbol] = len(self.order)
+            self.order.append(symbol)
+        return level
+
+    def truncate(self, nodes, symbols):
+        """Drop nodes with ids from nodes on, symbols from level symbols on, and the cache."""
+        unique, level_, low, high = self.unique, self.level, self.low, self.high
+        for node in range(nodes, len(level_)):
+            del unique[(level_[node], low[node], high[node])]
+        del level_[nodes:], low[nodes:], high[nodes:]
+        for symbol in self.order[symbols:]:
+            del self.levels[symbol]
+        del self.order[symbols:]
+        self.cache.clear()
+
+    def mk(self, level, low, high):
+        if low == high:
+            return low
+        key = (level, low, high)
+        node = self.unique.get(key)
+        if node is None:
+            node = self.unique[key] = len(self.level)
+            self.level.append(level)
+            self.low.append(low)
+            self.high.append(high)
+        return node
+
+    def var(self, symbol):
+        return self.mk(self.add_symbol(symbol), FALSE, TRUE)
+
+    def ite(self, f, g, h):
+        """If-then-else: the node for (f ∧ g) ∨ (¬f ∧ h)."""
+        # explicit stack instead of recursing per level, so BDDs over
+        # thousands of variables cannot overflow: a (f, g, h) frame is a call,
+        # a (key, top) frame joins the two cofactor results waiting on results
+        level_, low, high, cache = self.level, self.low, self.high, self.cache
+        results, stack = [], [(f, g, h)]
+        while stack:
+            frame = stack.pop()
+            if len(frame) == 2:
+                key, top = frame
+                node0, node1 = results[-2:]
+                del results[-2:]
+                node = self.mk(top, node0, node1)
+                if len(cache) >= self.cache_limit:
+                    cache.clear()
+                cache[key] = node
+                results.append(node)
+                continue
+            f, g, h = frame
+            if f == TRUE or g == h:
+                results.append(g)
+            elif f == FALSE:
+                results.append(h)
+            elif g == TRUE and h == FALSE:
+                results.append(f)
+            else:
+                node = cache.get(frame)
+                if node is not None:
+                    results.append(node)
+                    continue
+                top = min(level_[f], level_[g], level_[h])
+                f0, f1 = (low[f], high[f]) if level_[f] == top else (f, f)
+                g0, g1 = (low[g], high[g]) if level_[g] == top else (g, g)
+                h0, h1 = (low[h], high[h]) if level_[h] == top else (h, h)
+                stack += [(frame, top), (f1, g1, h1), (f0, g0, h0)]
+        return results[0]
+
+    def negate(self, f):
+        return self.ite(f, FALSE, TRUE)
+
+    def build(self, expr):
+        """Node for a tuple expression (as in entailment.py)."""
+        # post-order with an explicit stack, memoized by id(node) so shared
+        # subtrees are built once and never hashed as whole tuples
+        nodes = {}  # id(subexpression) -> node
+
+        def node_of(e):
+            return self.var(e) if isinstance(e, str) else nodes[id(e)]
+
+        def children(e):
+            op = e[0]
+            if op == 'and' or op == 'or':
+                return _operands(e, op)
+            if op == 'not' or op == 'implies':
+                return e[1:]
+            raise ValueError("Unknown operator", op)
+
+        stack = [(expr, False)]
+        while stack:
+            e, ready = stack.pop()
+            if isinstance(e, str) or id(e) in nodes:
+                continue
+            if not ready:
+                stack.append((e, True))
+                stack.extend((child, False) for child in reversed(children(e)))
+                continue
+            op = e[0]
+            if op == 'not':
+                node = self.negate(node_of(e[1]))
+            elif op == 'implies':
+                node = self.ite(node_of(e[1]), node_of(e[2]), TRUE)
+            else:
+                # combine chains pairwise, not left to right: folding a long
+                # conjunction of clauses one at a time rebuilds the whole
+                # partial BDD at every step (quadratic for an implication chain)
+                parts = [node_of(operand) for operand in _operands(e, op)]
+                while len(parts) > 1:
+                    if op == 'and':
+                        paired = [self.ite(f, g, FALSE) for f, g in zip(parts[::2], parts[1::2])]
+                    else:
+                        paired = [self.ite(f, TRUE, g) for f, g in zip(parts[::2], parts[1::2])]
+                    parts = paired + parts[len(paired) * 2:]
+                node = parts[0]
+            nodes[id(e)] = node
+        return node_of(expr)
+
+    def reachable(self, root):
+        """Ids of the inner nodes under root, bottom-up (increasing)."""
+        seen, stack = set(), [root]
+        while stack:
+            node = stack.pop()
+            if node > TRUE and node not in seen:
+                seen.add(node)
+                stack += [self.low[node], self.high[node]]
+        return sorted(seen)
+
+    def count_models(self, root, num_levels):
+        """Number of assignments to levels 0..num_levels-1 that make root true."""
+        level_ = self.level
+        def lv(node):
+            return num_levels if node <= TRUE else level_[node]
+        count = {FALSE: 0, TRUE: 1}
+        for node in self.reachable(root):
+            lo, hi, here = self.low[node], self.high[node], level_[node]
+            count[node] = (count[lo] << (lv(lo) - here - 1)) + (count[hi] << (lv(hi) - here - 1))
+        return count[root] << lv(root)
+
+    def path_to(self, root, target):
+        """{symbol: bool} along some path from root to the target terminal, or None."""
+        if root <= TRUE:
+            return {} if root == target else None
+        # every inner node of a reduced BDD is a non-constant function, so any
+        # child that is not the other terminal still reaches target
+        other = TRUE if target == FALSE else FALSE
+        assignment = {}
+        node = root
+        while node > TRUE:
+            symbol = self.order[self.level[node]]
+            if self.low[node] != other:
+                assignment[symbol] = False
+                node = self.low[node]
+            else:
+                assignment[symbol] = True
+                node = self.high[node]
+        return assignment if node == target else None
+
+
+def _operands(expr, op):
+    """Operands of a chain of op nodes, e.g. a, b, c for ('and', a, ('and', b, c))."""
+    result, stack = [], [expr]
+    while stack:
+        e = stack.pop()
+        if not isinstance(e, str) and e[0] == op:
+            stack += [e[2], e[1]]
+        else:
+            result.append(e)
+    return result
+
+def _first_appearance(expr):
+    symbols, stack = {}, [expr]
+    while stack:
+        e = stack.pop()
+        if isinstance(e, str):
+            symbols.setdefault(e, None)
+        else:
+            stack += reversed(e[1:])
+    return list(symbols)
+
+# -----------------------------
+# Compiled knowledge base
+# -----------------------------
+class CompiledKB:
+    def __init__(self, bdd, root, num_symbols, query_nodes=1 << 20):
+        self.bdd = bdd
+        self.root = root
+        self.num_symbols = num_symbols  # the KB's symbols are levels 0..num_symbols-1
+        self.query_nodes = query_nodes
+        self.kb_nodes = len(bdd)        # everything past these was added by queries
+        self.kb_order = len(bdd.order)
+        self.resets = 0
+
+    @property
+    def symbols(self):
+        return self.bdd.order[:self.num_symbols]
+
+    def entails(self, query):
+        """True if the KB entails query."""
+        return self._implication(query) == TRUE
+
+    def entails_all(self, queries):
+        """entails() for each query, sharing one BDD and operation cache."""
+        return [self.entails(query) for query in queries]
+
+    def counter_model(self, query):
+        """A model of KB ∧ ¬query as {symbol: bool} (unlisted symbols are free), or None."""
+        return self.bdd.path_to(self._implication(query), FALSE)
+
+    def model_count(self):
+        """Number of models of the KB over self.symbols."""
+        return self.bdd.count_models(self.root, self.num_symbols)
+
+    def is_satisfiable(self):
+        return self.root != FALSE
+
+    def _implication(self, query):
+        bdd = self.bdd
+        if len(bdd) - self.kb_nodes > self.query_nodes:
+            bdd.truncate(self.kb_nodes, self.kb_order)
+            self.resets += 1
+        return bdd.ite(self.root, bdd.build(query), TRUE)
+
+    def save(self, path):
+        """Write the KB's nodes (not those added by queries) to path."""
+        bdd = self.bdd
+        nodes = bdd.reachable(self.root)
+        ids = {FALSE: FALSE, TRUE: TRUE}
+        for node in nodes:
+            ids[node] = len(ids)
+        level = array("i", (bdd.level[n] for n in nodes))
+        low = array("i", (ids[bdd.low[n]] for n in nodes))
+        high = array("i", (ids[bdd.high[n]] for n in nodes))
+        names = json.dumps(self.symbols).encode()
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, self.num_symbols, len(nodes), ids[self.root], len(names)))
+            f.write(names)
+            for column in (level, low, high):
+                f.write(memoryview(column).cast("B"))
+
+
+def compile_kb(KB, order=None, cache_limit=1 << 20, query_nodes=1 << 20):
+    """
+    Compile KB into a CompiledKB. order lists symbols from the top level
+    down; KB symbols it leaves out follow in order of first appearance.
+    query_nodes bounds the nodes queries may add before the BDD is cut back.
+    """
+    bdd = BDD(order or (), cache_limit)
+    for symbol in _first_appearance(KB):
+        bdd.add_symbol(symbol)
+    root = bdd.build(KB)
+    return CompiledKB(bdd, root, len(bdd.order), query_nodes)
+
+def load(path, cache_limit=1 << 20, query_nodes=1 << 20):
+    """Read a CompiledKB written by CompiledKB.save."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < HEADER.size:
+        raise ValueError("Not a compiled KB file", path)
+    magic, num_symbols, count, root, name_size = HEADER.unpack_from(data)
+    item = array("i").itemsize
+    if magic != MAGIC or len(data) != HEADER.size + name_size + 3 * count * item:
+        raise ValueError("Not a compiled KB file", path)
+    start = HEADER.size + name_size
+    symbols = json.loads(data[HEADER.size:start])
+    columns = []
+    for i in range(3):
+        column = array("i")
+        column.frombytes(data[start + i * count * item:start + (i + 1) * count * item])
+        columns.append(column)
+    bdd = BDD(symbols, cache_limit)
+    bdd.level += columns[0]
+    bdd.low += columns[1]
+    bdd.high += columns[2]
+    for node in range(2, count + 2):
+        bdd.unique[(bdd.level[node], bdd.low[node], bdd.high[node])] = node
+    return CompiledKB(bdd, root, num_symbols, query_nodes)
+
+# -----------------------------
+# Batch queries on a process pool
+# -----------------------------
+_worker = {}
+
+def _init_worker(path):
+    _worker["kb"] = load(path)
+
+def _entails_chunk(task):
+    start, queries = task
+    return start, _worker["kb"].entails_all(queries)
+
+def batch_entails(path, queries, workers=None, chunk_size=256):
+    """entails() for every query against the KB saved at path, split across worker processes."""
+    results = [None] * len(queries)
+    tasks = [(i, queries[i:i + chunk_size]) for i in range(0, len(queries), chunk_size)]
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(path,)) as pool:
+        for start, answers in pool.imap_unordered(_entails_chunk, tasks):
+            results[start:start + len(answers)] = answers
+    return results
+
+
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+    import time
+
+    from .entailment import tt_entails
+
+    # a random 3-CNF KB over 16 symbols and 2000 random two-literal queries
+    rng = random.Random(0)
+    symbols = [f"P{i}" for i in range(16)]
+    def literal():
+        s = rng.choice(symbols)
+        return s if rng.random() < 0.5 else ('not', s)
+    kb = ('or', literal(), ('or', literal(), literal()))
+    for _ in range(30):
+        kb = ('and', kb, ('or', literal(), ('or', literal(), literal())))
+    queries = [(rng.choice(('or', 'and', 'implies')), literal(), literal()) for _ in range(2000)]
+
+    started = time.perf_counter()
+    compiled = compile_kb(kb)
+    print(f"compiled KB: {len(compiled.bdd)} nodes, {compiled.model_count()} of "
+          f"{2 ** len(compiled.symbols)} models, in {time.perf_counter() - started:.3f} s")
+
+    started = time.perf_counter()
+    answers = compiled.entails_all(queries)
+    print(f"BDD: {sum(answers)} of {len(queries)} entailed in {time.perf_counter() - started:.3f} s")
+    started = time.perf_counter()
+    expected = [tt_entails(kb, q) for q in queries]
+    print(f"truth table: same answers {answers == expected} in {time.perf_counter() - started:.3f} s")
+
+    path = os.path.join(tempfile.mkdtemp(), "kb.bdd")
+    compiled.save(path)
+    started = time.perf_counter()
+    answers = batch_entails(path, queries, workers=2)
+    print(f"2 workers from {os.path.getsize(path)} byte file: same answers {answers == expected} "
+          f"in {time.perf_counter() - started:.3f} s")
@@ -0,0 +1,310 @@
+# Benchmark suite for the search, game and logic modules
+# - Every input set is generated from a fixed seed, so two runs time the same work
+# - Puzzle boards are sampled at exact optimal depths from the distance table
+# - Each case records latency percentiles (p50/p90/p99 over all calls),
+#   throughput (calls/s, and nodes/s where the algorithm takes stats=), and
+#   peak traced memory per call (tracemalloc, measured in a separate pass so
+#   its overhead does not distort the timings)
+# - Results go to a JSON file; with --baseline the run is compared case by
+#   case and any p50 or memory growth above --threshold is flagged as a
+#   regression (exit status 1)
+#
+#   python -m ailab.benchmark --out bench.json
+#   python -m ailab.benchmark --quick --baseline bench.json --threshold 0.25
+#   python -m ailab.benchmark --only astar,tt_entails --save-baseline
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from . import (a_star, abpruning, entailment, forwardchaining, hill_climbing,
+               puzzle8_dfs as puzzle_dfs, puzzle8_idfs as puzzle_idfs, resolution, unification)
+from .puzzle_state import GOAL, to_lists, unrank
+from .distance_table import get_table
+from .search_stats import SearchStats
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(HERE, "benchmark_baseline.json")
+
+# -----------------------------
+# Seeded input corpora
+# -----------------------------
+def puzzle_corpus(depth, count, rng):
+    """count packed 3x3 states whose optimal solution is exactly depth moves."""
+    table = get_table()[:]
+    ranks = [r for r, d in enumerate(table) if d == depth]
+    return [unrank(r) for r in rng.sample(ranks, min(count, len(ranks)))]
+
+def random_tree(branching, depth, rng):
+    """Nested-list game tree with int leaves, as abpruning.alpha_beta expects."""
+    if depth == 0:
+        return rng.randint(-100, 100)
+    return [random_tree(branching, depth - 1, rng) for _ in range(branching)]
+
+def random_clause(symbols, width, rng):
+    lits = [s if rng.random() < 0.5 else ('not', s) for s in rng.sample(symbols, width)]
+    clause = lits[0]
+    for lit in lits[1:]:
+        clause = ('or', clause, lit)
+    return clause
+
+def entailment_problem(n_symbols, rng):
+    """
+    Random 3-CNF KB over n symbols plus a query that it entails (one of its
+    clauses widened by an extra literal), so tt_entails enumerates every model.
+    """
+    symbols = [f"P{i}" for i in range(n_symbols)]
+    clauses = [random_clause(symbols, 3, rng) for _ in range(n_symbols)]
+    kb = clauses[0]
+    for c in clauses[1:]:
+        kb = ('and', kb, c)
+    query = ('or', rng.choice(clauses), rng.choice(symbols))
+    return kb, query
+
+def chain_program(n):
+    """Facts Edge(N0,N1)..Edge(N{n-1},Nn) and the transitive-closure rules for Path."""
+    atom = forwardchaining.atom
+    facts = {atom("Edge", f"N{i}", f"N{i + 1}") for i in range(n)}
+    rules = [
+        ([atom("Edge", "x", "y")], atom("Path", "x", "y")),
+        ([atom("Edge", "x", "y"), atom("Path", "y", "z")], atom("Path", "x", "z")),
+    ]
+    return facts, rules, atom("Path", "N0", f"N{n}")
+
+def chain_kb(n):
+    """Clauses P0, ~P0 v P1, ..., ~P{n-1} v Pn and the query Pn, for resolution."""
+    L, C = resolution.L, resolution.C
+    kb = [C(L("P0", ()))]
+    kb += [C(L(f"P{i}", (), False), L(f"P{i + 1}", ())) for i in range(n)]
+    return kb, L(f"P{n}", ())
+
+def nested_terms(depth):
+    """f(f(...f(x, A)...)) against f(f(...f(B, y)...)); unifies to x=B, y=A."""
+    left, right = ['f', 'x', 'A'], ['f', 'B', 'y']
+    for _ in range(depth - 1):
+        left, right = ['f', left, 'C'], ['f', right, 'C']
+    return left, right
+
+# -----------------------------
+# Cases
+# -----------------------------
+# A case is (name, inputs, run, counted): run(item, stats) performs one call;
+# counted says whether run passes stats on, so nodes/s can be reported.
+def build_cases(seed, quick):
+    rng = random.Random(seed)
+    count = 3 if quick else 10
+    cases = []
+
+    def puzzles(depths):
+        return {d: puzzle_corpus(d, count, rng) for d in depths}
+
+    dfs_depths = (4, 8) if quick else (4, 8, 12)
+    for d, states in puzzles(dfs_depths).items():
+        cases.append((f"dfs/depth{d}", states,
+                      lambda s, stats, d=d: puzzle_dfs.dfs_search(s, GOAL, depth_limit=d, revisit=True,
+                                                                  stats=stats), True))
+    for d, states in puzzles(dfs_depths).items():
+        cases.append((f"iddfs/depth{d}", states,
+                      lambda s, stats: puzzle_idfs.iterative_deepening(s, GOAL, stats=stats), True))
+    ida_depths = (12, 18) if quick else (12, 18, 24)
+    for d, states in puzzles(ida_depths).items():
+        cases.append((f"idastar/depth{d}", states,
+                      lambda s, stats: puzzle_idfs.iterative_deepening(s, GOAL, heuristic=True,
+                                                                       stats=stats), True))
+    astar_depths = (12, 20) if quick else (12, 20, 26)
+    for d, states in puzzles(astar_depths).items():
+        boards = [to_lists(s) for s in states]
+        cases.append((f"astar/depth{d}", boards,
+                      lambda b, stats: a_star.a_star(b, stats=stats), True))
+    for d, states in puzzles((10, 20)).items():
+        boards = [to_lists(s) for s in states]
+        cases.append((f"hill_climbing/depth{d}", boards,
+                      lambda b, stats: hill_climbing.hill_climbing(b, stats=stats), True))
+
+    shapes = ((3, 6), (6, 4)) if quick else ((3, 6), (6, 4), (4, 8), (10, 5))
+    for b, d in shapes:
+        trees = [random_tree(b, d, rng) for _ in range(max(1, count // 3))]
+        cases.append((f"alpha_beta/b{b}d{d}", trees,
+                      lambda t, stats: abpruning.alpha_beta(t, 0, -math.inf, math.inf, True,
+                                                            stats=stats), True))
+        cases.append((f"alpha_beta_fast/b{b}d{d}", trees,
+                      lambda t, stats: abpruning.fast_alpha_beta(t, stats=stats), True))
+
+    sizes = (6, 10) if quick else (6, 10, 14, 16)
+    for n in sizes:
+        problems = [entailment_problem(n, rng) for _ in range(max(1, count // 3))]
+        cases.append((f"tt_entails/n{n}", problems,
+                      lambda p, stats: entailment.tt_entails(p[0], p[1], stats=stats), True))
+    # the larger sizes are KBs chained from hundreds of clauses, deeper than
+    # any truth-table backend could enumerate
+    for n in ((16, 100, 600) if quick else (16, 100, 300, 1000)):
+        problems = [entailment_problem(n, rng) for _ in range(max(1, count // 3))]
+        cases.append((f"sat_entails/n{n}", problems,
+                      lambda p, stats: entailment.tt_entails(p[0], p[1], stats=stats, backend="sat"),
+                      True))
+
+    for n in ((5, 10) if quick else (5, 10, 20)):
+        cases.append((f"forward_chain/chain{n}", [chain_program(n)],
+                      lambda p, stats: forwardchaining.forward_chain(p[0], p[1], p[2], stats=stats),
+                      True))
+    for n in ((2, 3) if quick else (2, 3, 4)):
+        cases.append((f"resolution/chain{n}", [chain_kb(n)],
+                      lambda p, stats: resolution.resolution(p[0], p[1], stats=stats), True))
+
+    for depth in ((10, 50) if quick else (10, 50, 200)):
+        cases.append((f"unify/depth{depth}", [nested_terms(depth)],
+                      lambda p, stats: unification.unify(p[0], p[1]), False))
+    return cases
+
+# -----------------------------
+# Measurement
+# -----------------------------
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    k = max(0, math.ceil(q / 100 * len(sorted_values)) - 1)
+    return sorted_values[k]
+
+def run_case(inputs, run, counted, repeat, min_time):
+    # warm-up: first-call costs (table loads, caches) are not what we measure
+    run(inputs[0], None)
+
+    latencies = []
+    started = time.perf_counter()
+    while True:
+        for _ in range(repeat):
+            for item in inputs:
+                t = time.perf_counter()
+                run(item, None)
+                latencies.append(time.perf_counter() - t)
+        if time.perf_counter() - started >= min_time:
+            break
+    total = time.perf_counter() - started
+
+    # separate pass for work counts and memory; tracemalloc slows calls down
+    stats = SearchStats() if counted else None
+    peak = 0
+    tracemalloc.start()
+    try:
+        for item in inputs:
+            tracemalloc.reset_peak()
+            run(item, stats)
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    result = {
+        "calls": len(latencies),
+        "mean": total / len(latencies),
+        "p50": percentile(latencies, 50),
+        "p90": percentile(latencies, 90),
+        "p99": percentile(latencies, 99),
+        "max": latencies[-1],
+        "calls_per_second": len(latencies) / total,
+        "peak_bytes": peak,
+    }
+    if stats is not None:
+        per_call = stats.expanded / len(inputs)
+        result["expanded_per_call"] = per_call
+        result["nodes_per_second"] = per_call / result["mean"] if result["mean"] else 0.0
+    return result
+
+def run_suite(seed=0, quick=False, only=None, repeat=1, min_time=0.2, progress=None):
+    results = {}
+    for name, inputs, run, counted in build_cases(seed, quick):
+        if only and not any(name.startswith(prefix) for prefix in only):
+            continue
+        results[name] = run_case(inputs, run, counted, repeat, min_time)
+        if progress:
+            progress(name, results[name])
+    return {
+        "meta": {
+            "seed": seed,
+            "quick": quick,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+# Absolute changes below these are timer/allocator noise, whatever the ratio
+NOISE_FLOOR = {"p50": 50e-6, "peak_bytes": 4096}
+
+def compare(current, baseline, threshold=0.2):
+    """
+    Return a list of (case, metric, baseline_value, current_value, ratio) for
+    every case present in both runs whose p50 latency or peak memory grew by
+    more than threshold (0.2 = 20%) and by more than its NOISE_FLOOR.
+    """
+    regressions = []
+    base = baseline.get("results", {})
+    for name, result in current["results"].items():
+        if name not in base:
+            continue
+        for metric in ("p50", "peak_bytes"):
+            old, new = base[name].get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            ratio = new / old
+            if ratio > 1 + threshold and new - old > NOISE_FLOOR[metric]:
+                regressions.append((name, metric, old, new, ratio))
+    return regressions
+
+def print_result(name, r):
+    line = (f"{name:28s} p50 {r['p50'] * 1e3:9.3f} ms  p99 {r['p99'] * 1e3:9.3f} ms  "
+            f"{r['calls_per_second']:10.1f} calls/s  peak {r['peak_bytes'] / 1024:8.1f} KiB")
+    if "nodes_per_second" in r:
+        line += f"  {r['nodes_per_second']:10.0f} nodes/s"
+    print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the search, game and logic modules.")
+    parser.add_argument("--out", default="benchmark_results.json", help="where to write this run's JSON")
+    parser.add_argument("--baseline", help="JSON from an earlier run to compare against")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help=f"also write this run to --baseline (default {os.path.basename(DEFAULT_BASELINE)})")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="relative growth in p50 or peak memory counted as a regression")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--quick", action="store_true", help="fewer, smaller inputs")
+    parser.add_argument("--only", help="comma-separated case name prefixes, e.g. astar,alpha_beta")
+    parser.add_argument("--repeat", type=int, default=1, help="timed passes over each input set")
+    parser.add_argument("--min-time", type=float, default=0.2, help="keep timing a case for at least this long")
+    args = parser.parse_args()
+
+    only = args.only.split(",") if args.only else None
+    report = run_suite(args.seed, args.quick, only, args.repeat, args.min_time, progress=print_result)
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+    print("Wrote", args.out)
+
+    baseline_path = args.baseline or DEFAULT_BASELINE
+    if args.save_baseline:
+        with open(baseline_path, "w") as f:
+            json.dump(report, f, indent=2)
+        print("Saved baseline", baseline_path)
+    elif os.path.exists(baseline_path):
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+        if baseline["meta"].get("quick") != args.quick or baseline["meta"].get("seed") != args.seed:
+            print("Note: baseline was recorded with different --quick/--seed settings")
+        regressions = compare(report, baseline, args.threshold)
+        for name, metric, old, new, ratio in regressions:
+            print(f"REGRESSION {name}: {metric} {old:.4g} -> {new:.4g} ({ratio:.2f}x)")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {baseline_path} (threshold {args.threshold:.0%})")
+    elif args.baseline:
+        print("Baseline", args.baseline, "not found")
+        sys.exit(2)
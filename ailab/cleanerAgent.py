@@ -52,17 +52,17 @@ class VacuumCleanerAgent:
         # NoOp does not change the state or location
 
 # --- Simulation ---
+if __name__ == "__main__":
+    # Example 1: Agent starts in A, both rooms are dirty
+    initial_state_1 = {'A': 'Dirty', 'B': 'Dirty'}
+    agent1 = VacuumCleanerAgent(location='A', state=initial_state_1)
+    print("--- Running Simulation 1 ---")
+    agent1.run(steps=10)
 
-# Example 1: Agent starts in A, both rooms are dirty
-initial_state_1 = {'A': 'Dirty', 'B': 'Dirty'}
-agent1 = VacuumCleanerAgent(location='A', state=initial_state_1)
-print("--- Running Simulation 1 ---")
-agent1.run(steps=10)
+    print("\n" + "="*20 + "\n")
 
-print("\n" + "="*20 + "\n")
-
-# Example 2: Agent starts in B, room A is dirty, room B is clean
-initial_state_2 = {'A': 'Dirty', 'B': 'Clean'}
-agent2 = VacuumCleanerAgent(location='B', state=initial_state_2)
-print("--- Running Simulation 2 ---")
-agent2.run(steps=10)
+    # Example 2: Agent starts in B, room A is dirty, room B is clean
+    initial_state_2 = {'A': 'Dirty', 'B': 'Clean'}
+    agent2 = VacuumCleanerAgent(location='B', state=initial_state_2)
+    print("--- Running Simulation 2 ---")
+    agent2.run(steps=10)
@@ -0,0 +1,104 @@
+# Exact distance-to-goal for every 8-puzzle state
+# - Built once by a backward BFS from the goal (the move graph is undirected)
+# - Stored as one byte per permutation rank (Lehmer code, see puzzle_state.rank);
+#   unreachable permutations (the other parity class) hold UNREACHABLE
+# - Persisted to disk and memory-mapped on load, so every worker process shares
+#   the same 362,880-byte page-cached table
+
+from collections import deque
+
+from .puzzle_state import GOAL, FACTORIALS, SIZE, pack, neighbors, rank
+from .table_files import map_table, table_path, write_table
+
+UNREACHABLE = 0xFF
+TABLE_SIZE = FACTORIALS[SIZE]
+FILE_NAME = "8puzzle_dist.bin"
+
+def build_table(goal=GOAL):
+    """Backward BFS from goal; returns a bytearray indexed by rank."""
+    table = bytearray([UNREACHABLE]) * TABLE_SIZE
+    table[rank(goal)] = 0
+    frontier = deque([goal])
+    while frontier:
+        state = frontier.popleft()
+        d = table[rank(state)] + 1
+        for _, neighbor in neighbors(state):
+            r = rank(neighbor)
+            if table[r] == UNREACHABLE:
+                table[r] = d
+                frontier.append(neighbor)
+    return table
+
+def save_table(table, path=None):
+    write_table(table, path or table_path(FILE_NAME))
+
+def load_table(path=None):
+    """Memory-map the table at path (default: in table_files.table_dir()), building it first if missing."""
+    return map_table(path or table_path(FILE_NAME), TABLE_SIZE, build_table)
+
+_table = None
+
+def get_table():
+    """Process-wide table, loaded lazily on first use."""
+    global _table
+    if _table is None:
+        _table = load_table()
+    return _table
+
+def distance(state, table=None):
+    """Optimal number of moves to the goal, or None if the state is unsolvable."""
+    if not isinstance(state, int):
+        state = pack(state)
+    if table is None:
+        table = get_table()
+    d = table[rank(state)]
+    return None if d == UNREACHABLE else d
+
+def solve_optimal(state, table=None):
+    """
+    Return (path, moves_list) for an optimal solution, or (None, None) if the
+    state is unsolvable. path holds packed states from start to goal.
+    Each step just picks a neighbor one move closer, so this is O(solution length).
+    """
+    if not isinstance(state, int):
+        if len(state) != 3:
+            raise ValueError("The distance table covers 3x3 boards only", state)
+        state = pack(state)
+    if table is None:
+        table = get_table()
+    d = table[rank(state)]
+    if d == UNREACHABLE:
+        return None, None
+
+    path = [state]
+    moves_list = []
+    while d > 0:
+        for move_name, neighbor in neighbors(state):
+            if table[rank(neighbor)] == d - 1:
+                state = neighbor
+                break
+        d -= 1
+        path.append(state)
+        moves_list.append(move_name)
+    return path, moves_list
+
+
+if __name__ == "__main__":
+    from .puzzle_state import unpack
+
+    start = ((2, 3, 1),
+             (4, 8, 6),
+             (5, 7, 0))
+
+    table = get_table()
+    depths = [d for d in table[:] if d != UNREACHABLE]
+    print(f"Distance table: {len(depths)} reachable states, max depth {max(depths)}")
+
+    path, moves_list = solve_optimal(start, table)
+    print(f"Optimal solution in {len(moves_list)} moves:\n")
+    for i, state in enumerate(path):
+        if i > 0:
+            print(f"Move empty block {moves_list[i-1]}")
+        for row in unpack(state):
+            print(' '.join(str(x) if x != 0 else 'x' for x in row))
+        print()
@@ -0,0 +1,281 @@
+from functools import lru_cache
+from itertools import product
+
+# -----------------------------
+# 1. Expression Evaluation
+# -----------------------------
+def evaluate(expr, model):
+    """Evaluate a propositional logic expression under a given model."""
+    if isinstance(expr, str):
+        return model[expr]
+
+    op = expr[0]
+
+    if op == 'not':
+        return not evaluate(expr[1], model)
+    elif op == 'and':
+        return evaluate(expr[1], model) and evaluate(expr[2], model)
+    elif op == 'or':
+        return evaluate(expr[1], model) or evaluate(expr[2], model)
+    elif op == 'implies':
+        return (not evaluate(expr[1], model)) or evaluate(expr[2], model)
+    else:
+        raise ValueError("Unknown operator", op)
+
+# -----------------------------
+# 2. Collect all propositional symbols
+# -----------------------------
+def get_symbols(expr):
+    """Return a set of all propositional symbols inside expr."""
+    try:
+        return set(_symbol_set(expr))
+    except TypeError:  # unhashable (list) expressions skip the cache
+        return set(_walk_symbols(expr))
+
+@lru_cache(maxsize=1024)
+def _symbol_set(expr):
+    return _walk_symbols(expr)
+
+def _walk_symbols(expr):
+    # explicit stack: KBs are often long left-nested chains of 'and'
+    symbols, stack = set(), [expr]
+    while stack:
+        e = stack.pop()
+        if isinstance(e, str):
+            symbols.add(e)
+        else:
+            stack.extend(e[1:])
+    return frozenset(symbols)
+
+# -----------------------------
+# 2b. Expression Compiler
+# -----------------------------
+# compile_expr turns an expression into one generated Python function
+#     f(mask, s0, s1, ...)  ->  value
+# over the symbols in a fixed order, so evaluating it costs one call instead
+# of a recursive walk that dispatches on the operator at every node.
+# - Operators become bitwise ops (not is "^ mask"), so the same function
+#   evaluates a single model (bools, mask=1) or a block of models packed in
+#   int bit columns (mask = all ones)
+# - Subexpressions are hash-consed: equal subtrees get one local variable and
+#   are computed once per call, across all expressions compiled together
+# - Functions are cached per (expressions, symbols); get_symbols is cached too
+def compile_expr(expr, symbols=None):
+    """Generated function f(mask, *values) evaluating expr; values follow symbols (default sorted)."""
+    return compile_exprs((expr,), symbols, single=True)
+
+def compile_exprs(exprs, symbols=None, single=False):
+    """Like compile_expr for several expressions at once; f returns a tuple of their values."""
+    exprs = tuple(exprs)
+    if symbols is None:
+        symbols = sorted(set().union(*map(get_symbols, exprs)))
+    try:
+        return _compile(exprs, tuple(symbols), single)
+    except TypeError:  # unhashable (list) expressions are compiled uncached
+        return _generate(exprs, tuple(symbols), single)
+
+@lru_cache(maxsize=256)
+def _compile(exprs, symbols, single):
+    return _generate(exprs, symbols, single)
+
+def _generate(exprs, symbols, single):
+    args = {s: f"s{i}" for i, s in enumerate(symbols)}
+    # Equal subtrees are found bottom-up: a node's signature is its operator
+    # plus its children's variable names, so no subtree is hashed twice.
+    slots = {}  # (op, child names...) -> local variable holding its value
+    names = {}  # id(node) -> its variable name, for nodes already emitted
+    lines = []
+
+    def name_of(expr):
+        if isinstance(expr, str):
+            if expr not in args:
+                raise ValueError("Symbol missing from symbol list", expr)
+            return args[expr]
+        return names[id(expr)]
+
+    def emit(root):
+        # post-order with an explicit stack, so deep expressions cannot overflow
+        stack = [(root, False)]
+        while stack:
+            expr, ready = stack.pop()
+            if isinstance(expr, str) or id(expr) in names:
+                continue
+            if not ready:
+                stack.append((expr, True))
+                stack.extend((child, False) for child in reversed(expr[1:]))
+                continue
+            op = expr[0]
+            operands = tuple(name_of(child) for child in expr[1:])
+            signature = (op,) + operands
+            name = slots.get(signature)
+            if name is None:
+                if op == 'not':
+                    code = f"{operands[0]} ^ mask"
+                elif op == 'and':
+                    code = f"{operands[0]} & {operands[1]}"
+                elif op == 'or':
+                    code = f"{operands[0]} | {operands[1]}"
+                elif op == 'implies':
+                    code = f"({operands[0]} ^ mask) | {operands[1]}"
+                else:
+                    raise ValueError("Unknown operator", op)
+                name = slots[signature] = f"t{len(lines)}"
+                lines.append(f"    {name} = {code}")
+            names[id(expr)] = name
+        return name_of(root)
+
+    results = [emit(expr) for expr in exprs]
+    result = results[0] if single else "(" + "".join(r + ", " for r in results) + ")"
+    source = "def compiled(" + ", ".join(["mask"] + list(args.values())) + "):\n"
+    source += "".join(line + "\n" for line in lines)
+    source += f"    return {result}\n"
+    namespace = {}
+    exec(source, namespace)
+    compiled = namespace["compiled"]
+    compiled.source = source
+    return compiled
+
+# -----------------------------
+# 3. Truth Table Entailment Check
+# -----------------------------
+# backend="models" walks the 2^n models one dict at a time. backend="bits"
+# (default) evaluates a whole block of models at once: model m of the
+# enumeration order (first symbol most significant) is bit m of a big int,
+# each symbol's column is a fixed bit pattern, and not/and/or/implies become
+# bitwise operations on those ints. Blocks of 2^CHUNK_BITS models are checked
+# in order, stopping at the first block holding a counter-model.
+# backend="sat" checks KB ∧ ¬query for satisfiability with the CDCL solver in
+# sat.py instead of enumerating, so it scales to hundreds of symbols; its
+# counter-model is some model of KB ∧ ¬query, not necessarily the first.
+CHUNK_BITS = 20
+BACKENDS = ("bits", "models", "sat")
+
+def tt_entails(KB, query, stats=None, backend="bits"):
+    """
+    Return True if KB entails query. KB and query are expressions.
+    backend is "bits" or "models" (truth-table enumeration; stats counts the
+    models checked as expanded) or "sat" (CDCL on KB ∧ ¬query; stats gets
+    the solver's counters, see sat.py). stats (search_stats.SearchStats)
+    tracer gets the counter-model, a {symbol: bool} dict over the symbols of
+    KB and query: the first in enumeration order for the truth-table
+    backends, whichever model the solver finds for "sat".
+    """
+    if backend not in BACKENDS:
+        raise ValueError("Unknown backend", backend)
+    if stats is not None:
+        stats.start()
+
+    try:
+        if backend == "sat":
+            from .sat import sat_counter_model
+            counter = sat_counter_model(KB, query, stats)
+            if counter is not None and stats is not None:
+                stats.trace("counter_model", model=counter)
+            return counter is None
+
+        symbols = sorted(get_symbols(KB) | get_symbols(query))
+        if backend == "bits":
+            counter = first_counter_model(KB, query, symbols, stats)
+            if counter is not None and stats is not None:
+                stats.trace("counter_model", model=counter)
+            return counter is None
+
+        counter = compile_expr(('and', KB, ('not', query)), symbols)
+        for values in product([False, True], repeat=len(symbols)):
+            if stats is not None:
+                stats.expanded += 1
+
+            if counter(1, *values):
+                # Found a model where KB is True but query is False → NOT entailment
+                if stats is not None:
+                    stats.trace("counter_model", model=dict(zip(symbols, values)))
+                return False
+
+        return True
+    finally:
+        if stats is not None:
+            stats.stop()
+
+def model_blocks(symbols, chunk_bits=None):
+    """
+    Yield (first_model_index, columns, mask) for consecutive blocks of the
+    2^n models. Within a block the last chunk_bits symbols alternate in runs
+    of 2^j models; the others are constant (all ones or all zeros).
+    """
+    n = len(symbols)
+    c = min(n, CHUNK_BITS if chunk_bits is None else chunk_bits)
+    size = 1 << c
+    mask = (1 << size) - 1
+    low = {}
+    for j in range(c):
+        run = 1 << j
+        # runs of `run` zeros then `run` ones, doubled up to the block size
+        pattern, width = ((1 << run) - 1) << run, 2 * run
+        while width < size:
+            pattern |= pattern << width
+            width *= 2
+        low[symbols[n - 1 - j]] = pattern
+    for block in range(1 << (n - c)):
+        columns = dict(low)
+        for i in range(n - c):
+            columns[symbols[i]] = mask if (block >> (n - c - 1 - i)) & 1 else 0
+        yield block * size, columns, mask
+
+def first_counter_model(KB, query, symbols=None, stats=None, chunk_bits=None):
+    """First model (in enumeration order) where KB holds and query fails, or None."""
+    if symbols is None:
+        symbols = sorted(get_symbols(KB) | get_symbols(query))
+    counter = compile_expr(('and', KB, ('not', query)), symbols)
+    for start, columns, mask in model_blocks(symbols, chunk_bits):
+        bad = counter(mask, *[columns[s] for s in symbols])
+        if bad:
+            offset = (bad & -bad).bit_length() - 1
+            if stats is not None:
+                stats.expanded += offset + 1
+            index = start + offset
+            n = len(symbols)
+            return {s: bool((index >> (n - 1 - i)) & 1) for i, s in enumerate(symbols)}
+        if stats is not None:
+            stats.expanded += mask.bit_length()
+    return None
+
+# -----------------------------
+# 4. Truth Table Printer
+# -----------------------------
+def print_truth_table(KB, query):
+    symbols = sorted(list(get_symbols(KB) | get_symbols(query)))
+    header = " | ".join(symbols) + " || KB | Query"
+    print(header)
+    print("-" * len(header))
+
+    both = compile_exprs((KB, query), symbols)
+    for values in product([False, True], repeat=len(symbols)):
+        kb, q = both(1, *values)
+
+        symbol_vals = " | ".join('T' if v else 'F' for v in values)
+        kb_val = 'T' if kb else 'F'
+        q_val = 'T' if q else 'F'
+
+        print(f"{symbol_vals} ||  {kb_val}  |   {q_val}")
+
+# -----------------------------
+# 5. Hard-coded Example
+# -----------------------------
+# KB = (A ∨ C) ∧ (B ∨ ¬C)
+KB = ('and',
+        ('or', 'A', 'C'),
+        ('or', 'B', ('not', 'C'))
+     )
+
+# Query α = A ∨ B
+query = ('or', 'A', 'B')
+
+# -----------------------------
+# 6. Run example
+# -----------------------------
+if __name__ == "__main__":
+    print("Truth Table:")
+    print_truth_table(KB, query)
+
+    print("\nDoes KB entail query?")
+    print(tt_entails(KB, query))
@@ -3,6 +3,8 @@
 # - Atom: tuple (predicate:str, args: tuple[str,...])
 # - Fact: same as Atom
 # - Rule: (premises: list[Atom], conclusion: Atom)
+# - Optional stats (search_stats.SearchStats): expanded rule matches,
+#   inferences (new facts), peak_closed (known facts); tracer gets "infer"
 
 from itertools import product
 
@@ -66,32 +68,47 @@ def match_premises_to_facts(premises, facts):
     backtrack(0, {})
     return matches
 
-def forward_chain(facts, rules, query=None, verbose=False):
+def forward_chain(facts, rules, query=None, verbose=False, stats=None):
     """
     facts: set of Atom tuples
     rules: list of (premises:list[Atom], conclusion:Atom)
     query: Atom or None
+    stats: optional search_stats.SearchStats
     Returns (derived_facts_set, proved_bool)
     """
     derived = set(facts)
-    while True:
-        new_facts = set()
-        for premises, conclusion in rules:
-            subs_list = match_premises_to_facts(premises, derived)
-            for subst in subs_list:
-                inferred = apply_subst_atom(conclusion, subst)
-                if inferred not in derived:
-                    if verbose:
-                        print("Applying rule:", " ^ ".join(format_atom(p) for p in premises),
-                              "=>", format_atom(conclusion), "with", subst)
-                        print("  Inferred:", format_atom(inferred))
-                    new_facts.add(inferred)
-        if not new_facts:
-            break
-        derived |= new_facts
-        if query and query in derived:
-            return derived, True
-    return derived, (query in derived) if query else (len(new_facts)>0)
+    if stats is not None:
+        stats.start()
+        stats.closed_size(len(derived))
+    try:
+        while True:
+            new_facts = set()
+            for premises, conclusion in rules:
+                subs_list = match_premises_to_facts(premises, derived)
+                if stats is not None:
+                    stats.expanded += len(subs_list)
+                for subst in subs_list:
+                    inferred = apply_subst_atom(conclusion, subst)
+                    if inferred not in derived:
+                        if verbose:
+                            print("Applying rule:", " ^ ".join(format_atom(p) for p in premises),
+                                  "=>", format_atom(conclusion), "with", subst)
+                            print("  Inferred:", format_atom(inferred))
+                        if stats is not None and inferred not in new_facts:
+                            stats.inferences += 1
+                            stats.trace("infer", fact=inferred, rule=(premises, conclusion), subst=subst)
+                        new_facts.add(inferred)
+            if not new_facts:
+                break
+            derived |= new_facts
+            if stats is not None:
+                stats.closed_size(len(derived))
+            if query and query in derived:
+                return derived, True
+        return derived, (query in derived) if query else (len(new_facts)>0)
+    finally:
+        if stats is not None:
+            stats.stop()
 
 # ---------- small helpers for display / building ----------
 def atom(pred, *args):
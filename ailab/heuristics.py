@@ -0,0 +1,223 @@
+# Pluggable N-puzzle heuristics (all admissible, measured to the standard goal)
+# - Each heuristic is a callable h(state) on packed states plus
+#   update(h, old_state, new_state, tile, from_cell, to_cell), which returns the
+#   neighbor's value by touching only what the moved tile affects
+# - Every heuristic is built for one board width (3, 4 or 5)
+# - Manhattan: sum of tile distances
+# - LinearConflict: Manhattan + 2 per tile that must leave its goal row/column
+#   to let another tile pass
+# - PatternDatabase: additive disjoint pattern databases. Each pattern is solved
+#   offline by a 0-1 BFS over (pattern tile cells, blank cell) where only moves of
+#   pattern tiles cost 1, so the per-pattern values can be summed. Tables are one
+#   byte per entry, written to disk and memory-mapped.
+
+from collections import deque
+
+from .puzzle_state import spec, manhattan
+from .table_files import map_table, table_path
+
+# -----------------------------
+# Manhattan
+# -----------------------------
+class Manhattan:
+    name = "manhattan"
+
+    def __init__(self, width=3):
+        self.width = width
+        self.table = spec(width).manhattan
+
+    def __call__(self, state):
+        return manhattan(state, self.table, self.width)
+
+    def update(self, h, old_state, new_state, tile, from_cell, to_cell):
+        return h - self.table[tile][from_cell] + self.table[tile][to_cell]
+
+# -----------------------------
+# Linear conflict
+# -----------------------------
+def _line_conflicts(goals):
+    """Tiles to remove so the rest of goals (goal positions along one line) are increasing."""
+    # longest increasing subsequence; lines are at most width long
+    best = []
+    for g in goals:
+        length = 1 + max((best[j] for j in range(len(best)) if goals[j] < g), default=0)
+        best.append(length)
+    return len(goals) - max(best, default=0)
+
+def _row_conflicts(state, r, s):
+    width, bits, tile_mask = s.width, s.bits, s.tile_mask
+    goals = []
+    for c in range(width):
+        tile = (state >> (bits * (r * width + c))) & tile_mask
+        if tile and (tile - 1) // width == r:
+            goals.append((tile - 1) % width)
+    return _line_conflicts(goals)
+
+def _col_conflicts(state, c, s):
+    width, bits, tile_mask = s.width, s.bits, s.tile_mask
+    goals = []
+    for r in range(width):
+        tile = (state >> (bits * (r * width + c))) & tile_mask
+        if tile and (tile - 1) % width == c:
+            goals.append((tile - 1) // width)
+    return _line_conflicts(goals)
+
+class LinearConflict:
+    name = "linear_conflict"
+
+    def __init__(self, width=3):
+        self.spec = spec(width)
+        self.table = self.spec.manhattan
+
+    def __call__(self, state):
+        s = self.spec
+        conflicts = 0
+        for i in range(s.width):
+            conflicts += _row_conflicts(state, i, s) + _col_conflicts(state, i, s)
+        return manhattan(state, self.table, s.width) + 2 * conflicts
+
+    def update(self, h, old_state, new_state, tile, from_cell, to_cell):
+        s = self.spec
+        width = s.width
+        h += self.table[tile][to_cell] - self.table[tile][from_cell]
+        # The blank is not part of any line, so a horizontal move keeps the
+        # row's tile order and only changes the two columns (and vice versa).
+        if from_cell // width == to_cell // width:
+            lines = (from_cell % width, to_cell % width)
+            conflicts = _col_conflicts
+        else:
+            lines = (from_cell // width, to_cell // width)
+            conflicts = _row_conflicts
+        for line in lines:
+            h += 2 * (conflicts(new_state, line, s) - conflicts(old_state, line, s))
+        return h
+
+# -----------------------------
+# Additive disjoint pattern databases
+# -----------------------------
+UNSEEN = 0xFF
+
+def pattern_index(state, weights, s):
+    """Index of the pattern tiles' cells: sum(cell * size**i) over the pattern."""
+    bits, tile_mask = s.bits, s.tile_mask
+    index = 0
+    for cell in range(s.size):
+        w = weights[(state >> (bits * cell)) & tile_mask]
+        if w:
+            index += cell * w
+    return index
+
+def build_pattern_db(pattern, width=3):
+    """
+    0-1 BFS from the goal over abstract states (cells of the pattern tiles plus
+    the blank). Returns a bytearray of size**len(pattern) entries holding the
+    minimum, over blank cells, of the pattern-move distance.
+    """
+    s = spec(width)
+    size = s.size
+    move_table = s.move_table
+    k = len(pattern)
+    blank_weight = size ** k
+    dist = bytearray([UNSEEN]) * (size ** (k + 1))
+
+    start = sum((tile - 1) * size ** i for i, tile in enumerate(pattern)) + (size - 1) * blank_weight
+    dist[start] = 0
+    frontier = deque([start])
+    while frontier:
+        index = frontier.popleft()
+        d = dist[index]
+        blank, cells = divmod(index, blank_weight)
+        occupied = {}
+        rest = cells
+        for i in range(k):
+            rest, cell = divmod(rest, size)
+            occupied[cell] = i
+        for _, target, _, _, _ in move_table[blank]:
+            i = occupied.get(target)
+            if i is None:  # a don't-care tile moves: free
+                child, cost = index + (target - blank) * blank_weight, 0
+            else:  # pattern tile i slides into the blank's cell
+                child = index + (blank - target) * size ** i + (target - blank) * blank_weight
+                cost = 1
+            if d + cost < dist[child]:
+                dist[child] = d + cost
+                if cost:
+                    frontier.append(child)
+                else:
+                    frontier.appendleft(child)
+
+    # dist is blank-major: take the elementwise minimum over the blank's slices
+    slices = [dist[b * blank_weight:(b + 1) * blank_weight] for b in range(size)]
+    return bytearray(map(min, *slices))
+
+def pattern_db_path(pattern, width=3, directory=None):
+    """File for pattern in directory (default: table_files.table_dir())."""
+    return table_path(f"pdb_{width}x{width}_{'-'.join(map(str, pattern))}.bin", directory)
+
+def load_pattern_db(pattern, width=3, directory=None):
+    """Memory-map the table for pattern, building and saving it first if missing."""
+    return map_table(pattern_db_path(pattern, width, directory), (width * width) ** len(pattern),
+                     lambda: build_pattern_db(pattern, width))
+
+# Table size is size**len(pattern) bytes: 4-tile patterns for the 8-puzzle,
+# 5-tile for the 15-puzzle (1 MB each, slow to build once) and 3-tile for the
+# 24-puzzle (larger patterns would not fit a byte-per-cell-combination table).
+DEFAULT_PARTITIONS = {
+    3: ((1, 2, 3, 4), (5, 6, 7, 8)),
+    4: ((1, 2, 3, 4, 5), (6, 7, 8, 9, 10), (11, 12, 13, 14, 15)),
+    5: tuple(tuple(range(i, i + 3)) for i in range(1, 25, 3)),
+}
+
+class PatternDatabase:
+    name = "pdb"
+
+    def __init__(self, width=3, partition=None, directory=None):
+        s = self.spec = spec(width)
+        if partition is None:
+            partition = DEFAULT_PARTITIONS[width]
+        tiles = sorted(t for pattern in partition for t in pattern)
+        if tiles != list(range(1, s.size)):
+            raise ValueError("Partition must cover every tile exactly once", partition)
+        self.partition = tuple(tuple(p) for p in partition)
+        self.tables = [load_pattern_db(p, width, directory) for p in self.partition]
+        # weights[p][tile] = size**i for the i-th tile of pattern p, else 0
+        self.weights = []
+        self.pattern_of = [None] * s.size
+        for p, pattern in enumerate(self.partition):
+            w = [0] * s.size
+            for i, tile in enumerate(pattern):
+                w[tile] = s.size ** i
+                self.pattern_of[tile] = p
+            self.weights.append(w)
+
+    def __call__(self, state):
+        return sum(table[pattern_index(state, w, self.spec)]
+                   for table, w in zip(self.tables, self.weights))
+
+    def update(self, h, old_state, new_state, tile, from_cell, to_cell):
+        # only the moved tile's pattern changes, and its index shifts by one term
+        p = self.pattern_of[tile]
+        table, w = self.tables[p], self.weights[p]
+        new_index = pattern_index(new_state, w, self.spec)
+        old_index = new_index - (to_cell - from_cell) * w[tile]
+        return h - table[old_index] + table[new_index]
+
+
+HEURISTICS = {
+    "manhattan": Manhattan,
+    "linear_conflict": LinearConflict,
+    "pdb": PatternDatabase,
+}
+
+_instances = {}
+
+def get_heuristic(heuristic, width=3):
+    """Accept a heuristic object or one of the names in HEURISTICS (instances are shared)."""
+    if isinstance(heuristic, str):
+        if heuristic not in HEURISTICS:
+            raise ValueError("Unknown heuristic", heuristic)
+        key = (heuristic, width)
+        if key not in _instances:
+            _instances[key] = HEURISTICS[heuristic](width)
+        return _instances[key]
+    return heuristic
@@ -0,0 +1,248 @@
+import math
+import multiprocessing
+import random
+import time
+from collections import deque
+
+from .puzzle_state import pack, to_lists, neighbors, manhattan, check_solvable
+from .search_stats import CLOCK_CHECK_INTERVAL
+
+# Goal state (3x3; larger boards use puzzle_state.standard_goal(width))
+goal_state = [[1, 2, 3],
+              [4, 5, 6],
+              [7, 8, 0]]   # 0 = blank
+
+# Print board (accepts a board or a packed int state)
+def print_state(state, width=3):
+    if isinstance(state, int):
+        state = to_lists(state, width)
+    for row in state:
+        print(row)
+    print()
+
+# Hill climbing algorithm
+# start_state: a 3x3, 4x4 or 5x5 board; unsolvable boards raise ValueError up front
+# verbose prints every step; stats (search_stats.SearchStats) counts steps as
+# expanded states and scored neighbors as generated
+def hill_climbing(start_state, verbose=False, stats=None):
+    check_solvable(start_state)
+    width = len(start_state)
+    current = pack(start_state)  # packed int state, see puzzle_state.py
+    current_h = manhattan(current, width=width)
+    if stats is not None:
+        stats.start()
+    
+    step = 0
+    while True:
+        if verbose:
+            print(f"Step {step}: h = {current_h} (Manhattan distance)")
+            print_state(current, width)
+        if stats is not None and stats.tracer is not None:
+            stats.trace("step", step=step, state=to_lists(current, width), h=current_h)
+        
+        if current_h == 0:
+            if verbose:
+                print("Reached goal!")
+            break
+        
+        best_neighbor = None
+        best_h = float("inf")
+        if stats is not None:
+            stats.expanded += 1
+        
+        for _, neighbor in neighbors(current, width):
+            h = manhattan(neighbor, width=width)
+            if stats is not None:
+                stats.generated += 1
+            if h < best_h:
+                best_h = h
+                best_neighbor = neighbor
+        
+        # If no improvement, stop
+        if best_h >= current_h:
+            if verbose:
+                print("No better neighbor found. Stopping.")
+            break
+        
+        # Move to better neighbor
+        current = best_neighbor
+        current_h = best_h
+        step += 1
+
+    if stats is not None:
+        stats.stop()
+    return to_lists(current, width), current_h
+
+
+# -----------------------------
+# Local search engine
+# -----------------------------
+# Strategies (all minimize Manhattan distance; h == 0 is the goal):
+# - "steepest":     move to the best neighbor
+# - "first_choice": try neighbors in random order, take the first better one
+# - "annealing":    random neighbor, accept a worse one with probability
+#                   exp(-delta / T); T starts at temperature and is multiplied
+#                   by cooling each step
+# Every move changes Manhattan distance by exactly 1, so 8-puzzle plateaus do
+# not exist and the escape hatch is a non-improving move instead: sideways > 0
+# lets steepest/first-choice take the best non-tabu neighbor even when it is
+# worse, up to that many moves in a row without a new best h. The last
+# tabu_size states are never re-entered.
+# The path has loops cut out (revisiting a state truncates back to it), and the
+# result is the path to the best state seen.
+STRATEGIES = ("steepest", "first_choice", "annealing")
+MIN_TEMPERATURE = 1e-12
+
+def local_search(start_state, strategy="steepest", max_steps=10000, sideways=0,
+                 tabu_size=0, temperature=2.0, cooling=0.999, seed=None, deadline=None,
+                 stats=None):
+    """
+    Return (path, h): boards from start to the best state found, and its h.
+    stats (search_stats.SearchStats) counts steps as expanded, scored
+    neighbors as generated and the longest loop-free path as peak_open.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError("Unknown strategy", strategy)
+    if strategy == "annealing" and not 0 < cooling < 1:
+        raise ValueError("Cooling must be between 0 and 1", cooling)
+    if strategy == "annealing" and temperature <= 0:
+        raise ValueError("Temperature must be positive", temperature)
+    check_solvable(start_state)
+    width = len(start_state)
+    rng = random.Random(seed)
+
+    current = pack(start_state)
+    current_h = manhattan(current, width=width)
+    path = [current]
+    index_of = {current: 0}
+    best_path, best_h = list(path), current_h
+    tabu = deque(maxlen=tabu_size) if tabu_size else None
+    sideways_left = sideways
+    t = temperature
+    if stats is not None:
+        stats.start()
+
+    for step in range(max_steps):
+        if current_h == 0:
+            break
+        if deadline is not None and step % CLOCK_CHECK_INTERVAL == 0 and time.monotonic() > deadline:
+            break
+
+        options = [n for _, n in neighbors(current, width) if not tabu or n not in tabu]
+        if not options:
+            break
+        if stats is not None:
+            stats.expanded += 1
+            stats.generated += len(options)
+        if strategy == "annealing":
+            chosen = rng.choice(options)
+            chosen_h = manhattan(chosen, width=width)
+            delta = chosen_h - current_h
+            t = max(t * cooling, MIN_TEMPERATURE)  # a zero temperature would divide by zero
+            if delta > 0 and rng.random() >= math.exp(-delta / t):
+                continue
+        else:
+            chosen = None
+            if strategy == "first_choice":
+                rng.shuffle(options)
+                for n in options:
+                    h = manhattan(n, width=width)
+                    if h < current_h:
+                        chosen, chosen_h = n, h
+                        break
+            if chosen is None:
+                scored = [(manhattan(n, width=width), n) for n in options]
+                low = min(h for h, _ in scored)
+                # random tie-breaking, so independent restarts explore differently
+                chosen_h, chosen = rng.choice([(h, n) for h, n in scored if h == low])
+            if chosen_h >= current_h:
+                if sideways_left == 0:
+                    break  # local minimum
+                sideways_left -= 1
+
+        if tabu is not None:
+            tabu.append(current)
+        current, current_h = chosen, chosen_h
+        if current in index_of:  # loop: cut it out of the path
+            for state in path[index_of[current] + 1:]:
+                del index_of[state]
+            del path[index_of[current] + 1:]
+        else:
+            index_of[current] = len(path)
+            path.append(current)
+        if current_h < best_h:
+            best_path, best_h = list(path), current_h
+            sideways_left = sideways
+            if stats is not None:
+                stats.trace("improve", step=step, h=best_h)
+        if stats is not None:
+            stats.open_size(len(path))
+
+    if stats is not None:
+        stats.stop()
+    return [to_lists(state, width) for state in best_path], best_h
+
+def _better(a, b):
+    """Prefer solved runs, then lower h, then shorter paths."""
+    (path_a, h_a), (path_b, h_b) = a, b
+    return (h_a, len(path_a)) < (h_b, len(path_b))
+
+def _run_restart(args):
+    start_state, seed, deadline, options = args
+    return local_search(start_state, seed=seed, deadline=deadline, **options)
+
+def random_restart(start_state, restarts=16, workers=None, time_limit=None, seed=0, **options):
+    """
+    Run `restarts` independent local searches (seeds seed, seed+1, ...) and
+    return the best (path, h). workers=0 runs them in this process; otherwise
+    they run on a process pool. With time_limit (seconds) every run stops at
+    the shared deadline and whatever finished by then is compared.
+    """
+    check_solvable(start_state)
+    start_state = [list(row) for row in start_state]
+    deadline = None if time_limit is None else time.monotonic() + time_limit
+    tasks = [(start_state, seed + i, deadline, options) for i in range(restarts)]
+
+    best = None
+    if workers == 0:
+        for task in tasks:
+            result = _run_restart(task)
+            if best is None or _better(result, best):
+                best = result
+            if deadline is not None and time.monotonic() > deadline:
+                break
+        return best
+
+    with multiprocessing.Pool(workers) as pool:
+        for result in pool.imap_unordered(_run_restart, tasks):
+            if best is None or _better(result, best):
+                best = result
+            if deadline is not None and time.monotonic() > deadline:
+                break
+    return best
+
+
+if __name__ == "__main__":
+    # Example start state (scrambled)
+    start_state = [[2, 8, 3],
+                   [1, 6, 4],
+                   [7, 0, 5]]
+
+    try:
+        hill_climbing(start_state, verbose=True)
+    except ValueError:
+        print("Start state", start_state, "cannot reach the goal (odd inversion count); skipped.")
+
+    # A reachable start where plain steepest ascent gets stuck
+    start_state = [[1, 2, 3],
+                   [7, 4, 6],
+                   [5, 8, 0]]
+    hill_climbing(start_state, verbose=True)
+
+    for strategy, options in [("steepest", dict(sideways=20, tabu_size=50)),
+                              ("first_choice", dict(sideways=20, tabu_size=50)),
+                              ("annealing", dict(temperature=3.0, cooling=0.999))]:
+        path, h = random_restart(start_state, restarts=8, time_limit=2.0,
+                                 strategy=strategy, **options)
+        result = f"solved in {len(path) - 1} moves" if h == 0 else f"stuck at h = {h}"
+        print(f"{strategy:12s}: {result}")
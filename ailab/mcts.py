@@ -0,0 +1,225 @@
+# Monte Carlo tree search (UCT) for abpruning.Game positions with int moves
+# (selfplay.MNKGame; cells are ints)
+# - Nodes live in flat arrays indexed by node number: parent, move, first
+#   child, child count, visits and total reward. Expanding a node appends all
+#   of its children at once, so a node's children are a contiguous block
+# - One iteration: descend by UCT (unvisited children first), expand the leaf,
+#   play random moves to the end, then add the reward to every node on the
+#   path. A node's reward is for the player who made the move into it:
+#   1 win, 0.5 draw, 0 loss; a finished game is read from evaluate()'s sign
+# - Budget: a number of iterations and/or a wall-clock time_limit in seconds
+# - play(move) keeps the subtree under move as the next root (tree reuse)
+# - parallel_search runs independent searches on a process pool and sums
+#   their root visit counts (root parallelization)
+
+import math
+import multiprocessing
+import random
+import time
+from array import array
+
+from .search_stats import CLOCK_CHECK_INTERVAL
+
+class MCTS:
+    def __init__(self, game, exploration=1.4, seed=None):
+        self.game = game
+        self.exploration = exploration
+        self.rng = random.Random(seed)
+        self._reset()
+
+    def _reset(self):
+        self.parent = array("i", [-1])
+        self.move = array("i", [-1])
+        self.first = array("i", [-1])  # -1 until expanded
+        self.count = array("i", [0])
+        self.visits = array("i", [0])
+        self.value = array("d", [0.0])
+        self.root = 0
+
+    def __len__(self):
+        return len(self.visits)
+
+    def _expand(self, node):
+        moves = self.game.moves()
+        self.first[node] = len(self.visits)
+        self.count[node] = len(moves)
+        n = len(moves)
+        self.parent.extend([node] * n)
+        self.move.extend(moves)
+        self.first.extend([-1] * n)
+        self.count.extend([0] * n)
+        self.visits.extend([0] * n)
+        self.value.extend([0.0] * n)
+
+    def _select(self, node):
+        first, end = self.first[node], self.first[node] + self.count[node]
+        visits, value = self.visits, self.value
+        log_n = math.log(visits[node] or 1)
+        c = self.exploration
+        best, best_score = first, -1.0
+        for child in range(first, end):
+            v = visits[child]
+            if v == 0:
+                return child
+            score = value[child] / v + c * math.sqrt(log_n / v)
+            if score > best_score:
+                best, best_score = child, score
+        return best
+
+    def _rollout(self):
+        """Random moves to the end; returns +1/0/-1 for the maximizing side, board restored."""
+        game, rng = self.game, self.rng
+        played = []
+        while not game.is_terminal():
+            moves = game.moves()
+            move = moves[rng.randrange(len(moves))]
+            game.apply(move)
+            played.append(move)
+        score = game.evaluate()
+        for move in reversed(played):
+            game.undo(move)
+        return (score > 0) - (score < 0)
+
+    def iterate(self):
+        game = self.game
+        node = self.root
+        path = [node]
+        while self.first[node] >= 0 and self.count[node] and not game.is_terminal():
+            node = self._select(node)
+            game.apply(self.move[node])
+            path.append(node)
+        if not game.is_terminal():
+            self._expand(node)
+            node = self._select(node)
+            game.apply(self.move[node])
+            path.append(node)
+        outcome = self._rollout()
+
+        # walk back up, undoing moves; the mover into node is the side not to move after it
+        for node in reversed(path):
+            self.visits[node] += 1
+            if node != self.root:
+                mover_is_max = not game.max_to_move
+                self.value[node] += 0.5 if outcome == 0 else float((outcome > 0) == mover_is_max)
+                game.undo(self.move[node])
+
+    def search(self, iterations=None, time_limit=None):
+        """Run until iterations or time_limit (seconds) is used up; returns the best move."""
+        if iterations is None and time_limit is None:
+            raise ValueError("Give an iteration count or a time limit")
+        if self.game.is_terminal():
+            return None
+        deadline = None if time_limit is None else time.monotonic() + time_limit
+        done = 0
+        while iterations is None or done < iterations:
+            if deadline is not None and done % CLOCK_CHECK_INTERVAL == 0 and time.monotonic() > deadline:
+                break
+            self.iterate()
+            done += 1
+        return self.best_move()
+
+    def root_stats(self):
+        """{move: (visits, total reward)} for the root's children."""
+        first = self.first[self.root]
+        if first < 0:
+            return {}
+        return {self.move[c]: (self.visits[c], self.value[c])
+                for c in range(first, first + self.count[self.root])}
+
+    def best_move(self):
+        stats = self.root_stats()
+        if not stats:
+            return None
+        return max(stats, key=lambda m: stats[m][0])  # most visited child
+
+    def play(self, move):
+        """Apply move to the game and keep its subtree as the new root."""
+        first = self.first[self.root]
+        child = -1
+        if first >= 0:
+            for c in range(first, first + self.count[self.root]):
+                if self.move[c] == move:
+                    child = c
+                    break
+        self.game.apply(move)
+        if child < 0:
+            self._reset()
+        else:
+            self._compact(child)
+
+    def _compact(self, new_root):
+        """Copy the subtree under new_root into fresh arrays, dropping the rest."""
+        old = (self.parent, self.move, self.first, self.count, self.visits, self.value)
+        o_parent, o_move, o_first, o_count, o_visits, o_value = old
+        self._reset()
+        self.move[0], self.visits[0], self.value[0] = o_move[new_root], o_visits[new_root], o_value[new_root]
+        queue = [(new_root, 0)]  # (old index, new index); children blocks stay contiguous
+        for old_node, new_node in queue:
+            first = o_first[old_node]
+            if first < 0:
+                continue
+            n = o_count[old_node]
+            self.first[new_node] = len(self.visits)
+            self.count[new_node] = n
+            for c in range(first, first + n):
+                queue.append((c, len(self.visits)))
+                self.parent.append(new_node)
+                self.move.append(o_move[c])
+                self.first.append(-1)
+                self.count.append(0)
+                self.visits.append(o_visits[c])
+                self.value.append(o_value[c])
+
+# -----------------------------
+# Root parallelization
+# -----------------------------
+def _search_task(task):
+    game, iterations, time_limit, exploration, seed = task
+    engine = MCTS(game, exploration, seed)
+    engine.search(iterations, time_limit)
+    return engine.root_stats()
+
+def parallel_search(game, iterations=None, time_limit=None, workers=None, exploration=1.4, seed=0):
+    """
+    Independent searches of game (one per worker, seeds seed, seed+1, ...)
+    with their root visit counts summed. Returns (best_move, merged stats).
+    The game must be picklable; each worker searches its own copy.
+    """
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    tasks = [(game, iterations, time_limit, exploration, seed + i) for i in range(workers)]
+    merged = {}
+    with multiprocessing.Pool(workers) as pool:
+        for stats in pool.imap_unordered(_search_task, tasks):
+            for move, (visits, value) in stats.items():
+                v, w = merged.get(move, (0, 0.0))
+                merged[move] = (v + visits, w + value)
+    if not merged:
+        return None, merged
+    return max(merged, key=lambda m: merged[m][0]), merged
+
+
+if __name__ == "__main__":
+    from .selfplay import MNKGame, alpha_beta_strategy
+
+    # MCTS (X, 2000 iterations per move, reusing its tree) against depth-2
+    # alpha-beta (O) on 5x5 four-in-a-row
+    rng = random.Random(0)
+    tally = {1: 0, -1: 0, 0: 0}
+    opponent = alpha_beta_strategy(2)
+    started = time.perf_counter()
+    for g in range(6):
+        game = MNKGame(5, 5, 4)
+        engine = MCTS(game, seed=g)
+        while not game.is_terminal():
+            if game.max_to_move:
+                engine.play(engine.search(iterations=2000))
+            else:
+                engine.play(opponent(game, rng))
+        tally[game.result()] += 1
+    print(f"5,5,4 MCTS vs alphabeta:2: {tally[1]} wins, {tally[-1]} losses, {tally[0]} draws "
+          f"in {time.perf_counter() - started:.1f} s")
+
+    move, stats = parallel_search(MNKGame(7, 7, 5), time_limit=1.0, workers=2)
+    print("7,7,5 opening move from 2 root-parallel searches:", divmod(move, 7),
+          "visits", stats[move][0], "of", sum(v for v, _ in stats.values()))
@@ -0,0 +1,82 @@
+# Open lists for best-first search over (f, g, state) entries
+# - HeapQueue: binary heap, ties on f broken by smaller g (the original a_star order)
+# - BucketQueue: "dial" queue for small integer f. buckets[f][g] is a stack, pop
+#   takes the lowest f, then the highest g (deepest first), then the newest entry,
+#   so push/pop are O(1) amortized and no tuples are compared
+# Both are plain containers: the search skips stale entries (a state popped
+# with a g worse than its best known g) itself, which is the lazy deletion.
+
+import heapq
+
+
+class HeapQueue:
+    def __init__(self):
+        self.heap = []
+
+    def push(self, f, g, state):
+        heapq.heappush(self.heap, (f, g, state))
+
+    def pop(self):
+        return heapq.heappop(self.heap)
+
+    def top_f(self):
+        """Smallest f on the list (stale entries included, so a lower bound)."""
+        return self.heap[0][0]
+
+    def __len__(self):
+        return len(self.heap)
+
+
+class BucketQueue:
+    def __init__(self):
+        self.buckets = []   # buckets[f][g] -> list of states (LIFO)
+        self.min_f = 0
+        self.size = 0
+
+    def push(self, f, g, state):
+        buckets = self.buckets
+        while len(buckets) <= f:
+            buckets.append([])
+        by_g = buckets[f]
+        while len(by_g) <= g:
+            by_g.append([])
+        by_g[g].append(state)
+        self.size += 1
+        if f < self.min_f:
+            self.min_f = f
+
+    def pop(self):
+        if not self.size:
+            raise IndexError("pop from empty BucketQueue")
+        buckets = self.buckets
+        while True:
+            by_g = buckets[self.min_f]
+            # drop empty stacks at the top so the last one is the highest live g
+            while by_g and not by_g[-1]:
+                by_g.pop()
+            if by_g:
+                self.size -= 1
+                return self.min_f, len(by_g) - 1, by_g[-1].pop()
+            self.min_f += 1
+
+    def top_f(self):
+        """Smallest f on the list (stale entries included, so a lower bound)."""
+        if not self.size:
+            raise IndexError("top_f of empty BucketQueue")
+        while not any(self.buckets[self.min_f]):
+            self.min_f += 1
+        return self.min_f
+
+    def __len__(self):
+        return self.size
+
+
+OPEN_LISTS = {
+    "heap": HeapQueue,
+    "bucket": BucketQueue,
+}
+
+def make_open_list(kind):
+    if kind not in OPEN_LISTS:
+        raise ValueError("Unknown open list", kind)
+    return OPEN_LISTS[kind]()
@@ -0,0 +1,194 @@
+# Depth-first search for the 8-puzzle (and 4x4/5x5 boards) with an explicit stack
+# - No recursion: the stack is the path itself plus, per level, the index of the
+#   next move to try, so depth is bounded only by memory and the search can be
+#   suspended between solutions (dfs_solutions is a generator)
+# - Visited states on 3x3 boards live in a bitset indexed by permutation rank
+#   within the solvability class (puzzle_state.half_rank), so it needs 9!/2
+#   bits (~23 KB). Larger boards fall back to a set.
+# - revisit=False: each state is entered once. With a depth_limit a state is
+#                  entered again when reached by a shorter path: the first
+#                  visit may have come down a deep branch with too little
+#                  depth left below it, so marking states visited alone would
+#                  miss solutions that exist within the limit. The depths live
+#                  in a byte per rank (3x3) or a dict
+#   revisit=True:  only states on the current path are excluded, so every
+#                  cycle-free solution within depth_limit is yielded in turn
+
+from .puzzle_state import spec, pack, unpack, half_rank, check_solvable, FACTORIALS
+
+start = ((2, 3, 1),
+         (4, 8, 6),
+         (5, 7, 0))  # 0 represents the empty block
+
+goal = ((1, 2, 3),
+        (4, 5, 6),
+        (7, 8, 0))
+
+
+class RankBitset:
+    """Set of 3x3 packed states from one solvability class, one bit per state."""
+
+    def __init__(self):
+        self.bits = bytearray((FACTORIALS[9] // 2 + 7) // 8)
+
+    def add(self, state):
+        i = half_rank(state)
+        self.bits[i >> 3] |= 1 << (i & 7)
+
+    def discard(self, state):
+        i = half_rank(state)
+        self.bits[i >> 3] &= ~(1 << (i & 7)) & 0xFF
+
+    def __contains__(self, state):
+        i = half_rank(state)
+        return bool(self.bits[i >> 3] & (1 << (i & 7)))
+
+
+class RankDepths:
+    """Shallowest depth (0-254) at which each 3x3 state of one solvability class was reached."""
+    UNSEEN = 0xFF
+
+    def __init__(self):
+        self.depths = bytearray([self.UNSEEN]) * (FACTORIALS[9] // 2)
+
+    def get(self, state, default=None):
+        d = self.depths[half_rank(state)]
+        return default if d == self.UNSEEN else d
+
+    def __setitem__(self, state, depth):
+        self.depths[half_rank(state)] = depth
+
+
+def print_state(state, width=3):
+    for row in unpack(state, width):
+        print(' '.join(str(x) if x != 0 else 'x' for x in row))
+    print()
+
+def dfs_solutions(start_state, goal_state, depth_limit=None, width=3, revisit=False, stats=None):
+    """
+    Yield (path, moves_list) for each solution found, depth first. States are
+    packed ints (see puzzle_state.py). Unreachable goals raise ValueError
+    before any search. stats (search_stats.SearchStats) counts expanded
+    states, generated successors, peak path length (peak_open) and, without
+    revisit, visited states (peak_closed); elapsed covers time spent inside
+    the generator.
+    """
+    check_solvable(unpack(start_state, width), unpack(goal_state, width))
+    s = spec(width)
+    move_table, blank_shift, tile_mask = s.move_table, s.blank_shift, s.tile_mask
+    depths = None
+    if depth_limit is not None and not revisit:
+        depths = RankDepths() if width == 3 and depth_limit < RankDepths.UNSEEN else {}
+        depths[start_state] = 0
+    visited = RankBitset() if width == 3 else set()
+
+    path = [start_state]
+    moves_list = []
+    next_move = [0]  # per level: index of the next move_table entry to try
+    visited.add(start_state)
+    closed = 1
+    if stats is not None:
+        stats.start()
+
+    while path:
+        state = path[-1]
+        entries = move_table[state >> blank_shift]
+        i = next_move[-1]
+
+        if state == goal_state:
+            if stats is not None:
+                stats.stop()
+                stats.trace("solution", moves=len(moves_list))
+            yield list(path), list(moves_list)
+            if stats is not None:
+                stats.start()
+            i = len(entries)  # never search below the goal
+
+        if i == len(entries) or (depth_limit is not None and len(moves_list) >= depth_limit):
+            path.pop()  # Backtrack
+            next_move.pop()
+            if moves_list:
+                moves_list.pop()
+            if revisit:
+                visited.discard(state)
+            continue
+
+        next_move[-1] = i + 1
+        if stats is not None and i == 0:
+            stats.expanded += 1
+        name, _, shift, spread, blank_xor = entries[i]
+        neighbor = state ^ (((state >> shift) & tile_mask) * spread) ^ blank_xor
+        if depths is not None:
+            depth = len(moves_list) + 1
+            seen_at = depths.get(neighbor)
+            if seen_at is not None and seen_at <= depth:
+                continue
+            depths[neighbor] = depth
+            first_visit = seen_at is None
+        else:
+            if neighbor in visited:
+                continue
+            visited.add(neighbor)
+            first_visit = True
+        path.append(neighbor)
+        moves_list.append(name)
+        next_move.append(0)
+        if stats is not None:
+            stats.generated += 1
+            closed += first_visit
+            stats.open_size(len(path))
+            if not revisit:
+                stats.closed_size(closed)
+
+    if stats is not None:
+        stats.stop()
+
+def dfs_search(start_state, goal_state, depth_limit=None, width=3, revisit=False, stats=None):
+    """First solution from dfs_solutions as (path, moves_list), or (None, None)."""
+    for path, moves_list in dfs_solutions(start_state, goal_state, depth_limit, width, revisit, stats):
+        return path, moves_list
+    return None, None
+
+
+if __name__ == "__main__":
+    start_state, goal_state = pack(start), pack(goal)
+
+    print("Searching for a solution using DFS...")
+    path, moves_list = dfs_search(start_state, goal_state)
+    print(f"Plain DFS found a solution of {len(moves_list)} moves.\n")
+
+    depth_limit = 20
+    print(f"Searching for solutions of at most {depth_limit} moves...")
+    solutions = dfs_solutions(start_state, goal_state, depth_limit, revisit=True)
+    path, moves_list = next(solutions, (None, None))
+
+    if path:
+        print(f"Solution found in {len(path)-1} moves:\n")
+        for i in range(len(path)):
+            if i > 0:
+                print(f"Move empty block {moves_list[i-1]}")
+            print_state(path[i])
+        more = sum(1 for _ in zip(range(4), solutions))
+        print(f"...and at least {more} more solution(s) within {depth_limit} moves.")
+    else:
+        print("No solution found within the search limits.")
+
+    # regression check against the exact distance table: with depth_limit set
+    # to the optimal length, plain DFS must find a solution, and one move less
+    # must find none
+    import random
+    from .distance_table import distance
+    from .puzzle_state import neighbors
+
+    rng = random.Random(0)
+    checked = 0
+    for _ in range(60):
+        state = goal_state
+        for _ in range(rng.randint(4, 16)):
+            state = rng.choice(list(neighbors(state)))[1]
+        d = distance(state)
+        found, _ = dfs_search(state, goal_state, depth_limit=d)
+        if found is None or (d > 0 and dfs_search(state, goal_state, depth_limit=d - 1)[0] is not None):
+            raise AssertionError("Depth-limited DFS disagrees with the distance table", unpack(state))
+        checked += 1
+    print(f"Depth-limited DFS matched the distance table on {checked} boards.")
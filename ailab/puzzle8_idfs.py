@@ -0,0 +1,131 @@
+# Iterative deepening for the 8-puzzle and its 4x4/5x5 siblings (IDDFS and IDA*)
+# - One mutable path/moves_list shared by the whole search: append on the way
+#   down, pop on backtrack, so memory is O(depth) and there is no visited set
+# - The only duplicate check is "don't undo the previous move"
+# - IDA* bounds each iteration by f = g + Manhattan, updated incrementally
+#   from the single tile that moves
+
+import math
+
+from .puzzle_state import (spec, pack, unpack, manhattan, manhattan_table,
+                          check_solvable)
+
+start = ((2, 3, 1),
+         (4, 8, 6),
+         (5, 7, 0))  # 0 represents the empty block
+
+goal = ((1, 2, 3),
+        (4, 5, 6),
+        (7, 8, 0))
+
+# Longest optimal solution per board width (the 5x5 value is the best known upper bound)
+MAX_DEPTHS = {3: 31, 4: 80, 5: 205}
+
+FOUND = -1
+
+
+def print_state(state, width=3):
+    for row in unpack(state, width):
+        print(' '.join(str(x) if x != 0 else 'x' for x in row))
+    print()
+
+def bounded_search(path, moves_list, goal_state, h, limit, dist, s, stats=None):
+    """
+    Depth-first search below path[-1] with f = g + h <= limit.
+    dist is the Manhattan table (None for plain IDDFS, where h stays 0);
+    s is the board's PuzzleSpec; stats an optional search_stats.SearchStats.
+    Returns FOUND (path/moves_list then hold the solution) or the smallest f
+    that exceeded the limit, which becomes the next iteration's limit.
+    """
+    state = path[-1]
+    f = len(moves_list) + h
+    if f > limit:
+        return f
+    if state == goal_state:
+        return FOUND
+    if stats is not None:
+        stats.expanded += 1
+        stats.open_size(len(path))
+
+    parent = path[-2] if len(path) > 1 else None
+    blank = state >> s.blank_shift
+    next_limit = math.inf
+    for name, target, shift, spread, blank_xor in s.move_table[blank]:
+        tile = (state >> shift) & s.tile_mask
+        neighbor = state ^ (tile * spread) ^ blank_xor
+        if neighbor == parent:
+            continue
+        # only the moved tile changes its Manhattan contribution
+        child_h = h + dist[tile][blank] - dist[tile][target] if dist else 0
+
+        path.append(neighbor)
+        moves_list.append(name)
+        if stats is not None:
+            stats.generated += 1
+        t = bounded_search(path, moves_list, goal_state, child_h, limit, dist, s, stats)
+        if t == FOUND:
+            return FOUND
+        if t < next_limit:
+            next_limit = t
+        path.pop()  # Backtrack
+        moves_list.pop()
+
+    return next_limit
+
+def iterative_deepening(start_state, goal_state, heuristic=False, max_depth=None, width=3,
+                        stats=None):
+    """
+    IDDFS (heuristic=False) or IDA* (heuristic=True) on packed states of the given
+    width; returns (path, moves_list) or (None, None). Raises ValueError up front
+    if goal_state is unreachable from start_state.
+    """
+    s = spec(width)
+    check_solvable(unpack(start_state, width), unpack(goal_state, width))
+    if max_depth is None:
+        max_depth = MAX_DEPTHS[width]
+    dist = manhattan_table(unpack(goal_state, width)) if heuristic else None
+    h = manhattan(start_state, dist, width) if heuristic else 0
+
+    path = [start_state]
+    moves_list = []
+    limit = h
+    if stats is not None:
+        stats.start()
+    try:
+        while limit <= max_depth:
+            if stats is not None:
+                stats.trace("iteration", limit=limit, expanded=stats.expanded)
+            t = bounded_search(path, moves_list, goal_state, h, limit, dist, s, stats)
+            if t == FOUND:
+                return path, moves_list
+            limit = t
+        return None, None
+    finally:
+        if stats is not None:
+            stats.stop()
+
+def dfs_iterative(start_state, goal_state, mode="iddfs", max_depth=None, width=3, stats=None):
+    # States are packed ints (see puzzle_state.py); mode is 'iddfs' or 'ida*'.
+    # Returns (path, moves) or (None, None); nothing is printed, the tracer
+    # gets a "search" event naming the mode
+    if mode not in ("iddfs", "ida*"):
+        raise ValueError("Unknown mode", mode)
+
+    if stats is not None:
+        stats.trace("search", mode=mode)
+    return iterative_deepening(start_state, goal_state, heuristic=(mode == "ida*"),
+                               max_depth=max_depth, width=width, stats=stats)
+
+
+if __name__ == "__main__":
+    print("Searching for a solution using iterative deepening DFS...")
+    solution_path, moves_list = dfs_iterative(pack(start), pack(goal))
+
+    if solution_path:
+        print(f"Solution found in {len(solution_path)-1} moves:\n")
+        for i in range(len(solution_path)):
+            if i > 0:
+                print(f"Move empty block {moves_list[i-1]}")
+            print_state(solution_path[i])
+    else:
+        print("No solution found.")
@@ -0,0 +1,247 @@
+# Compact N-puzzle state shared by the search modules (3x3, 4x4 and 5x5 boards)
+# - A board is a single int: cell i (row-major) holds its tile in bits
+#   BITS*i .. BITS*i+BITS-1 (4 bits per cell up to 4x4, 5 bits for 5x5)
+# - The blank's cell index is cached in the bits above the board, so no scan is needed
+# - Per-width tables (moves, Manhattan distances, goal) live in a PuzzleSpec;
+#   move_table[blank] lists the precomputed moves for every blank position, so a
+#   neighbor is one shift/mask to read the moving tile plus two xors
+# - The module-level constants (WIDTH, MOVE_TABLE, GOAL, ...) are the 3x3 ones
+
+# blank moves in this order (same as the DFS scripts): up, down, left, right
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+MOVE_NAMES = ['up', 'down', 'left', 'right']
+
+WIDTHS = (3, 4, 5)
+
+
+def standard_goal(width):
+    """Goal board with tiles 1..n in order and the blank in the bottom-right corner."""
+    tiles = list(range(1, width * width)) + [0]
+    return tuple(tuple(tiles[r * width:(r + 1) * width]) for r in range(width))
+
+def cell_bits(width):
+    """Bits per cell: enough for the largest tile, at least 4."""
+    return max(4, (width * width - 1).bit_length())
+
+class PuzzleSpec:
+    """Bit layout and precomputed tables for one board width."""
+
+    def __init__(self, width):
+        if width not in WIDTHS:
+            raise ValueError("Unsupported board width", width)
+        self.width = width
+        self.size = width * width
+        self.bits = cell_bits(width)
+        self.tile_mask = (1 << self.bits) - 1
+        self.blank_shift = self.bits * self.size
+        self.board_mask = (1 << self.blank_shift) - 1
+        self.move_table = self._build_move_table()
+        self.manhattan = manhattan_table(standard_goal(width))
+        self.goal = pack(standard_goal(width))
+
+    # Moving the blank from b to t: the tile at t goes to b. Since the blank cell
+    # holds 0, new = state ^ tile*(bit(t) | bit(b)) ^ ((b ^ t) << blank_shift).
+    def _build_move_table(self):
+        width, bits = self.width, self.bits
+        table = []
+        for b in range(self.size):
+            r, c = divmod(b, width)
+            entries = []
+            for (dr, dc), name in zip(DIRECTIONS, MOVE_NAMES):
+                nr, nc = r + dr, c + dc
+                if 0 <= nr < width and 0 <= nc < width:
+                    t = nr * width + nc
+                    entries.append((name, t, bits * t,
+                                    (1 << (bits * t)) | (1 << (bits * b)),
+                                    (b ^ t) << self.blank_shift))
+            table.append(tuple(entries))
+        return tuple(table)
+
+_specs = {}
+
+def spec(width):
+    """Shared PuzzleSpec for width (built on first use)."""
+    s = _specs.get(width)
+    if s is None:
+        s = _specs[width] = PuzzleSpec(width)
+    return s
+
+
+def pack(board):
+    """Pack a square board (tuple-of-tuples or list-of-lists, 0 = blank) into an int."""
+    width = len(board)
+    size = width * width
+    bits = cell_bits(width)
+    cells = [v for row in board for v in row]
+    if len(cells) != size or sorted(cells) != list(range(size)):
+        raise ValueError("Board must hold each of 0..n-1 exactly once", board)
+    state = 0
+    for i, tile in enumerate(cells):
+        state |= tile << (bits * i)
+    return state | (cells.index(0) << (bits * size))
+
+def unpack(state, width=3):
+    """Return the board as a tuple of tuples."""
+    s = spec(width)
+    cells = [(state >> (s.bits * i)) & s.tile_mask for i in range(s.size)]
+    return tuple(tuple(cells[r * width:(r + 1) * width]) for r in range(width))
+
+def to_lists(state, width=3):
+    """Return the board as a list of lists (the format a_star/hill_climbing print)."""
+    return [list(row) for row in unpack(state, width)]
+
+def blank_index(state, width=3):
+    return state >> spec(width).blank_shift
+
+def tile_at(state, cell, width=3):
+    s = spec(width)
+    return (state >> (s.bits * cell)) & s.tile_mask
+
+def apply_move(state, entry, width=3):
+    """Apply one move-table entry to state."""
+    _, _, shift, spread, blank_xor = entry
+    return state ^ (((state >> shift) & spec(width).tile_mask) * spread) ^ blank_xor
+
+def neighbors(state, width=3):
+    """Yield (move_name, neighbor_state) for every legal blank move."""
+    s = spec(width)
+    tile_mask = s.tile_mask
+    for name, _, shift, spread, blank_xor in s.move_table[state >> s.blank_shift]:
+        yield name, state ^ (((state >> shift) & tile_mask) * spread) ^ blank_xor
+
+def path_moves(path, width=3):
+    """Move names taking each packed state in path to the next."""
+    s = spec(width)
+    moves = []
+    for before, after in zip(path, path[1:]):
+        target = after >> s.blank_shift
+        moves.append(next(e[0] for e in s.move_table[before >> s.blank_shift] if e[1] == target))
+    return moves
+
+def follow_moves(state, moves, width=3):
+    """Packed states visited by applying the named moves to state (state included)."""
+    s = spec(width)
+    path = [state]
+    for name in moves:
+        entry = next((e for e in s.move_table[state >> s.blank_shift] if e[0] == name), None)
+        if entry is None:
+            raise ValueError("Illegal move", name)
+        state = apply_move(state, entry, width)
+        path.append(state)
+    return path
+
+# -----------------------------
+# Manhattan distance
+# -----------------------------
+def manhattan_table(goal_board):
+    """table[tile][cell] = distance of tile at cell from its cell in goal_board (blank costs 0)."""
+    width = len(goal_board)
+    goal_cell = {tile: cell for cell, tile in enumerate(v for row in goal_board for v in row)}
+    return tuple(
+        tuple(0 if tile == 0 else
+              abs(goal_cell[tile] // width - cell // width) + abs(goal_cell[tile] % width - cell % width)
+              for cell in range(width * width))
+        for tile in range(width * width))
+
+def manhattan(state, table=None, width=3):
+    s = spec(width)
+    if table is None:
+        table = s.manhattan
+    bits, tile_mask = s.bits, s.tile_mask
+    distance = 0
+    for cell in range(s.size):
+        distance += table[(state >> (bits * cell)) & tile_mask][cell]
+    return distance
+
+# -----------------------------
+# Solvability (inversion parity)
+# -----------------------------
+def parity(board):
+    """
+    Invariant of every legal move: inversion count (blank excluded), plus the
+    blank's row on even-width boards, modulo 2. Two boards reach each other
+    iff their parities match. O(n^2) in the number of tiles.
+    """
+    tiles = [v for row in board for v in row if v != 0]
+    inversions = 0
+    for i in range(len(tiles)):
+        for j in range(i + 1, len(tiles)):
+            if tiles[i] > tiles[j]:
+                inversions += 1
+    if len(board) % 2 == 0:
+        inversions += next(r for r, row in enumerate(board) if 0 in row)
+    return inversions % 2
+
+def is_solvable(board, goal_board=None):
+    """True iff goal_board (default: the standard goal) is reachable from board."""
+    if goal_board is None:
+        goal_board = standard_goal(len(board))
+    return parity(board) == parity(goal_board)
+
+def check_solvable(board, goal_board=None):
+    """Raise ValueError before any search starts if board cannot reach the goal."""
+    if not is_solvable(board, goal_board):
+        raise ValueError("Unsolvable puzzle", board)
+
+
+# 3x3 constants used by the 8-puzzle-only modules (distance table, scripts)
+_s3 = spec(3)
+WIDTH = _s3.width
+SIZE = _s3.size
+BITS = _s3.bits
+TILE_MASK = _s3.tile_mask
+BLANK_SHIFT = _s3.blank_shift
+BOARD_MASK = _s3.board_mask
+MOVE_TABLE = _s3.move_table
+MANHATTAN = _s3.manhattan
+GOAL = _s3.goal
+del _s3
+
+# -----------------------------
+# Permutation rank (Lehmer code)
+# -----------------------------
+FACTORIALS = [1] * (SIZE + 1)
+for _i in range(1, SIZE + 1):
+    FACTORIALS[_i] = FACTORIALS[_i - 1] * _i
+del _i
+
+def rank(state):
+    """Lexicographic rank of a 3x3 board's permutation, in range(SIZE!)."""
+    r = 0
+    used = 0
+    for cell in range(SIZE):
+        tile = (state >> (BITS * cell)) & TILE_MASK
+        # tiles smaller than this one that are still unused
+        r += (tile - (used & ((1 << tile) - 1)).bit_count()) * FACTORIALS[SIZE - 1 - cell]
+        used |= 1 << tile
+    return r
+
+def unrank(r):
+    """Inverse of rank(): rebuild the packed 3x3 state."""
+    remaining = list(range(SIZE))
+    state = 0
+    for cell in range(SIZE):
+        digit, r = divmod(r, FACTORIALS[SIZE - 1 - cell])
+        tile = remaining.pop(digit)
+        state |= tile << (BITS * cell)
+        if tile == 0:
+            state |= cell << BLANK_SHIFT
+    return state
+
+def half_rank(state):
+    """
+    Index of a 3x3 state within its solvability class, in range(SIZE! // 2):
+    blank cell * 8!/2 + (Lehmer rank of the 8 tiles in reading order) // 2.
+    On odd-width boards solvability is the tiles' inversion parity, and tile
+    ranks r and r ^ 1 differ by one swap, so the halved rank is unique per class.
+    """
+    r = 0
+    used = 0
+    k = SIZE - 2
+    for cell in range(SIZE):
+        tile = (state >> (BITS * cell)) & TILE_MASK
+        if tile:
+            r += (tile - 1 - (used & ((1 << tile) - 1)).bit_count()) * FACTORIALS[k]
+            used |= 1 << tile
+            k -= 1
+    return (state >> BLANK_SHIFT) * (FACTORIALS[SIZE - 1] // 2) + (r >> 1)
@@ -2,6 +2,8 @@
 # - Literals: (pred, args_tuple, positive_bool)
 # - Clause: frozenset of literals
 # - Very small unifier (variables start lowercase). No standardization/occurs-check.
+# - Optional stats (search_stats.SearchStats): expanded clause pairs, generated
+#   resolvents, inferences (new clauses kept), peak_closed (clause set size)
 
 from itertools import combinations
 
@@ -55,24 +57,39 @@ def resolve(ci, cj):
                     resolvents.add(r)
     return resolvents
 
-def resolution(kb, query):
+def resolution(kb, query, stats=None):
     # add negated query
     q = (query[0], query[1], not query[2])
     clauses = set(kb)
     clauses.add(frozenset({q}))
-    new = set()
-    while True:
-        pairs = list(combinations(list(clauses), 2))
-        generated = set()
-        for ci, cj in pairs:
-            for r in resolve(ci, cj):
-                if not r:  # empty clause
-                    return True
-                if r not in clauses:
-                    generated.add(r)
-        if not generated:
-            return False
-        clauses |= generated
+    if stats is not None:
+        stats.start()
+        stats.closed_size(len(clauses))
+    try:
+        while True:
+            pairs = list(combinations(list(clauses), 2))
+            generated = set()
+            for ci, cj in pairs:
+                resolvents = resolve(ci, cj)
+                if stats is not None:
+                    stats.expanded += 1
+                    stats.generated += len(resolvents)
+                for r in resolvents:
+                    if not r:  # empty clause
+                        if stats is not None:
+                            stats.trace("empty_clause", parents=(ci, cj))
+                        return True
+                    if r not in clauses:
+                        generated.add(r)
+            if not generated:
+                return False
+            clauses |= generated
+            if stats is not None:
+                stats.inferences += len(generated)
+                stats.closed_size(len(clauses))
+    finally:
+        if stats is not None:
+            stats.stop()
 
 # --- Example KB (converted from your notebook) ---
 def L(pred, args, pos=True): return (pred, tuple(args), pos)
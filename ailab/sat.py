@@ -0,0 +1,511 @@
+# SAT-based entailment: KB entails query iff KB ∧ ¬query is unsatisfiable
+# - CNF: Tseitin conversion of the entailment.py tuple expressions. Top-level
+#   conjunctions are split into separate clauses and top-level disjunctions
+#   become one clause; every other subexpression gets a fresh variable defined
+#   by a few clauses. Equal subexpressions share one variable (hash-consing),
+#   and not is free (a negated literal)
+# - Solver: CDCL (conflict-driven clause learning)
+#   - two watched literals per clause, so propagation only visits clauses
+#     whose watched literal just became false
+#   - first-UIP conflict analysis; the learnt clause is asserting after a
+#     backjump to its second-highest level
+#   - VSIDS branching: variables in learnt conflicts get their activity
+#     bumped, the bump grows 5% per conflict (decay), and decisions take the
+#     most active unassigned variable from a lazy heap; saved phases pick the
+#     polarity
+#   - Luby restarts (RESTART_UNIT conflicts times the Luby sequence). At each
+#     restart the longer half of the learnt clauses is dropped once there are
+#     more than max_learnts
+# - Literals are DIMACS-style ints: variable v is v (true) or -v (false)
+# - stats (search_stats.SearchStats): propagated literals (decided or
+#   implied) count as expanded, decisions as generated, conflicts as cutoffs.
+#   Easy instances are decided by propagation alone, so decisions would
+#   often be zero
+
+import heapq
+
+RESTART_UNIT = 100
+VAR_DECAY = 0.95
+
+def luby(i):
+    """i-th element (from 1) of the Luby sequence 1 1 2 1 1 2 4 1 1 2 ..."""
+    size, power = 1, 1
+    while size < i:
+        power *= 2
+        size = 2 * size + 1
+    while size != i:
+        size //= 2
+        power //= 2
+        if i > size:
+            i -= size
+    return power
+
+def _index(lit):
+    """Watch-list slot of a literal."""
+    return 2 * lit if lit > 0 else -2 * lit + 1
+
+class Solver:
+    def __init__(self, stats=None, max_learnts=2000):
+        self.stats = stats
+        self.max_learnts = max_learnts
+        self.num_vars = 0
+        self.clauses = []
+        self.learnts = []
+        self.watches = [[], []]   # _index(lit) -> clauses watching lit
+        self.value = [0]          # per variable: 1 true, -1 false, 0 unassigned
+        self.level = [0]
+        self.reason = [None]      # clause that propagated the variable
+        self.activity = [0.0]
+        self.phase = [False]
+        self.heap = []            # (-activity, var); may hold stale entries
+        self.bump = 1.0
+        self.trail = []
+        self.trail_lim = []       # trail length at each decision
+        self.qhead = 0
+        self.ok = True            # False once the clauses are unsatisfiable at level 0
+        self.model = None
+        self.decisions = 0
+        self.propagations = 0
+        self.conflicts = 0
+        self.restarts = 0
+        self.reported = (0, 0, 0)  # (decisions, propagations, conflicts) already added to stats
+
+    def new_var(self):
+        self.num_vars += 1
+        v = self.num_vars
+        self.value.append(0)
+        self.level.append(0)
+        self.reason.append(None)
+        self.activity.append(0.0)
+        self.phase.append(False)
+        self.watches += [[], []]
+        heapq.heappush(self.heap, (0.0, v))
+        return v
+
+    def _lit_value(self, lit):
+        v = self.value[abs(lit)]
+        return v if lit > 0 else -v
+
+    def add_clause(self, lits):
+        """Add a clause (iterable of literals). Returns False if the formula became unsatisfiable."""
+        if self.trail_lim:
+            self._cancel_until(0)
+        if not self.ok:
+            return False
+        clause = []
+        for lit in lits:
+            if not lit or abs(lit) > self.num_vars:
+                raise ValueError("Literal of an unknown variable", lit)
+            value = self._lit_value(lit)
+            if value == 1 or -lit in clause:
+                return True  # satisfied at level 0, or a tautology
+            if value == 0 and lit not in clause:
+                clause.append(lit)
+        if not clause:
+            self.ok = False
+        elif len(clause) == 1:
+            self._enqueue(clause[0], None)
+            if self._propagate() is not None:
+                self.conflicts += 1
+                self.ok = False
+        else:
+            self.clauses.append(clause)
+            self._watch(clause)
+        return self.ok
+
+    def _watch(self, clause):
+        self.watches[_index(clause[0])].append(clause)
+        self.watches[_index(clause[1])].append(clause)
+
+    def _enqueue(self, lit, reason):
+        v = abs(lit)
+        self.value[v] = 1 if lit > 0 else -1
+        self.level[v] = len(self.trail_lim)
+        self.reason[v] = reason
+        self.trail.append(lit)
+
+    def _propagate(self):
+        """Unit propagation over the trail; returns a conflicting clause or None."""
+        value, watches, trail = self.value, self.watches, self.trail
+        while self.qhead < len(trail):
+            false_lit = -trail[self.qhead]
+            self.qhead += 1
+            self.propagations += 1
+            watching = watches[2 * false_lit if false_lit > 0 else -2 * false_lit + 1]
+            i = j = 0
+            end = len(watching)
+            while i < end:
+                clause = watching[i]
+                i += 1
+                if clause[0] == false_lit:
+                    clause[0], clause[1] = clause[1], false_lit
+                first = clause[0]
+                first_value = value[first] if first > 0 else -value[-first]
+                if first_value == 1:
+                    watching[j] = clause
+                    j += 1
+                    continue
+                # look for a new literal to watch instead of false_lit
+                for k in range(2, len(clause)):
+                    lit = clause[k]
+                    if (value[lit] if lit > 0 else -value[-lit]) != -1:
+                        clause[1], clause[k] = lit, false_lit
+                        watches[2 * lit if lit > 0 else -2 * lit + 1].append(clause)
+                        break
+                else:
+                    watching[j] = clause
+                    j += 1
+                    if first_value == -1:
+                        while i < end:
+                            watching[j] = watching[i]
+                            j += 1
+                            i += 1
+                        del watching[j:]
+                        self.qhead = len(trail)
+                        return clause
+                    self._enqueue(first, clause)
+            del watching[j:]
+        return None
+
+    def _analyze(self, conflict):
+        """First-UIP learnt clause (asserting literal first) and the level to jump back to."""
+        level, reason, trail = self.level, self.reason, self.trail
+        current = len(self.trail_lim)
+        seen = set()
+        learnt = [0]
+        pending = 0
+        clause, p = conflict, 0
+        index = len(trail) - 1
+        while True:
+            for q in clause:
+                v = abs(q)
+                if q == p or v in seen or level[v] == 0:
+                    continue
+                seen.add(v)
+                self._bump(v)
+                if level[v] == current:
+                    pending += 1
+                else:
+                    learnt.append(q)
+            while abs(trail[index]) not in seen:
+                index -= 1
+            p = trail[index]
+            index -= 1
+            pending -= 1
+            if pending == 0:
+                break
+            clause = reason[abs(p)]
+        learnt[0] = -p
+        back = 0
+        if len(learnt) > 1:
+            # the highest remaining level goes second so it is watched
+            top = max(range(1, len(learnt)), key=lambda k: level[abs(learnt[k])])
+            learnt[1], learnt[top] = learnt[top], learnt[1]
+            back = level[abs(learnt[1])]
+        return learnt, back
+
+    def _bump(self, v):
+        self.activity[v] += self.bump
+        if self.activity[v] > 1e100:
+            self.activity = [a * 1e-100 for a in self.activity]
+            self.bump *= 1e-100
+            self._rebuild_heap()
+
+    def _rebuild_heap(self):
+        self.heap = [(-self.activity[v], v) for v in range(1, self.num_vars + 1) if not self.value[v]]
+        heapq.heapify(self.heap)
+
+    def _cancel_until(self, level):
+        if len(self.trail_lim) <= level:
+            return
+        value, activity, heap = self.value, self.activity, self.heap
+        for lit in self.trail[self.trail_lim[level]:]:
+            v = abs(lit)
+            value[v] = 0
+            self.reason[v] = None
+            self.phase[v] = lit > 0
+            heapq.heappush(heap, (-activity[v], v))
+        del self.trail[self.trail_lim[level]:]
+        del self.trail_lim[level:]
+        self.qhead = len(self.trail)
+
+    def _decide(self):
+        """Most active unassigned variable, or 0 when every variable is assigned."""
+        heap, value = self.heap, self.value
+        if len(heap) > 4 * self.num_vars + 64:
+            self._rebuild_heap()
+            heap = self.heap
+        while heap:
+            _, v = heapq.heappop(heap)
+            if not value[v]:
+                return v
+        return 0
+
+    def _reduce(self):
+        """Drop the longer half of the learnt clauses (call at level 0)."""
+        self.learnts.sort(key=len)
+        kept = self.learnts[:len(self.learnts) // 2]
+        if len(kept) == len(self.learnts):
+            return
+        self.learnts = kept
+        for v in range(1, self.num_vars + 1):
+            self.reason[v] = None  # level-0 reasons are never consulted
+        self.watches = [[] for _ in self.watches]
+        for clause in self.clauses:
+            self._watch(clause)
+        for clause in kept:
+            self._watch(clause)
+
+    def solve(self, max_conflicts=None):
+        """
+        True if satisfiable (self.model then maps each variable to a bool),
+        False if unsatisfiable, None if max_conflicts ran out first.
+        Counts since the previous solve, including propagation done by
+        add_clause, are added to stats.
+        """
+        try:
+            return self._search(max_conflicts)
+        finally:
+            stats = self.stats
+            decisions, propagations, conflicts = self.reported
+            if stats is not None:
+                stats.expanded += self.propagations - propagations
+                stats.generated += self.decisions - decisions
+                stats.cutoffs += self.conflicts - conflicts
+            self.reported = (self.decisions, self.propagations, self.conflicts)
+
+    def _search(self, max_conflicts):
+        self.model = None
+        if not self.ok:
+            return False
+        if self._propagate() is not None:
+            self.conflicts += 1
+            self.ok = False
+            return False
+        budget = None if max_conflicts is None else self.conflicts + max_conflicts
+        restart = self.conflicts + RESTART_UNIT * luby(self.restarts + 1)
+        while True:
+            conflict = self._propagate()
+            if conflict is not None:
+                self.conflicts += 1
+                if not self.trail_lim:
+                    self.ok = False
+                    return False
+                learnt, back = self._analyze(conflict)
+                self._cancel_until(back)
+                if len(learnt) == 1:
+                    self._enqueue(learnt[0], None)
+                else:
+                    self.learnts.append(learnt)
+                    self._watch(learnt)
+                    self._enqueue(learnt[0], learnt)
+                self.bump /= VAR_DECAY
+                continue
+            if budget is not None and self.conflicts >= budget:
+                self._cancel_until(0)
+                return None
+            if self.conflicts >= restart:
+                self.restarts += 1
+                restart = self.conflicts + RESTART_UNIT * luby(self.restarts + 1)
+                self._cancel_until(0)
+                if len(self.learnts) > self.max_learnts:
+                    self._reduce()
+                continue
+            v = self._decide()
+            if not v:
+                self.model = [None] + [x > 0 for x in self.value[1:]]
+                self._cancel_until(0)
+                return True
+            self.decisions += 1
+            self.trail_lim.append(len(self.trail))
+            self._enqueue(v if self.phase[v] else -v, None)
+
+# -----------------------------
+# Tseitin CNF
+# -----------------------------
+class CNF:
+    """Adds tuple expressions (as in entailment.py) to a Solver as clauses."""
+    def __init__(self, solver=None):
+        self.solver = Solver() if solver is None else solver
+        self.variables = {}  # symbol -> variable
+        self.gates = {}      # (op, input literals...) -> gate variable
+
+    def var(self, symbol):
+        v = self.variables.get(symbol)
+        if v is None:
+            v = self.variables[symbol] = self.solver.new_var()
+        return v
+
+    def _operands(self, expr, op):
+        """Operands of a chain of op nodes, e.g. a, b, c for ('and', a, ('and', b, c))."""
+        result, stack = [], [expr]
+        while stack:
+            e = stack.pop()
+            if not isinstance(e, str) and e[0] == op:
+                stack += [e[2], e[1]]
+            else:
+                result.append(e)
+        return result
+
+    def literal(self, expr):
+        """Literal equivalent to expr, defining gate variables as needed."""
+        # post-order with an explicit stack, so deep expressions cannot
+        # overflow; gates are shared by signature (op plus input literals),
+        # so equal subtrees are never hashed as whole tuples
+        literals = {}  # id(node) -> literal, for nodes of this expr already done
+
+        def literal_of(e):
+            return self.var(e) if isinstance(e, str) else literals[id(e)]
+
+        def children(e):
+            op = e[0]
+            if op == 'and' or op == 'or':
+                return self._operands(e, op)
+            if op == 'not' or op == 'implies':
+                return e[1:]
+            raise ValueError("Unknown operator", op)
+
+        stack = [(expr, False)]
+        while stack:
+            e, ready = stack.pop()
+            if isinstance(e, str) or id(e) in literals:
+                continue
+            if not ready:
+                stack.append((e, True))
+                stack.extend((child, False) for child in reversed(children(e)))
+                continue
+            op = e[0]
+            if op == 'not':
+                literals[id(e)] = -literal_of(e[1])
+                continue
+            if op == 'implies':
+                inputs = (-literal_of(e[1]), literal_of(e[2]))
+                op = 'or'
+            else:
+                inputs = tuple(literal_of(child) for child in self._operands(e, op))
+            literals[id(e)] = self._gate(op, inputs)
+        return literal_of(expr)
+
+    def _gate(self, op, inputs):
+        """Variable g defined as g <-> op(inputs), shared by equal signatures."""
+        signature = (op,) + inputs
+        g = self.gates.get(signature)
+        if g is None:
+            g = self.gates[signature] = self.solver.new_var()
+            sign = 1 if op == 'and' else -1  # an or gate is an and gate of negations, negated
+            add = self.solver.add_clause
+            for lit in inputs:
+                add([-sign * g, sign * lit])
+            add([sign * g] + [-sign * lit for lit in inputs])
+        return g
+
+    def add(self, expr):
+        """Assert expr: one or more clauses."""
+        stack = [(expr, True)]
+        while stack:
+            e, positive = stack.pop()
+            if isinstance(e, str):
+                self.solver.add_clause([self.var(e) if positive else -self.var(e)])
+                continue
+            op = e[0]
+            if op == 'not':
+                stack.append((e[1], not positive))
+            elif op == 'and' and positive:
+                stack += [(e[1], True), (e[2], True)]
+            elif op == 'or' and not positive:
+                stack += [(e[1], False), (e[2], False)]
+            elif op == 'implies' and not positive:
+                stack += [(e[1], True), (e[2], False)]
+            else:
+                self.solver.add_clause(self._disjuncts(e, positive))
+
+    def _disjuncts(self, expr, positive):
+        """Literals of a clause equivalent to expr (positive) or ¬expr."""
+        lits, stack = [], [(expr, positive)]
+        while stack:
+            e, positive = stack.pop()
+            op = None if isinstance(e, str) else e[0]
+            if op == 'not':
+                stack.append((e[1], not positive))
+            elif op == 'or' and positive:
+                stack += [(e[1], True), (e[2], True)]
+            elif op == 'and' and not positive:
+                stack += [(e[1], False), (e[2], False)]
+            elif op == 'implies' and positive:
+                stack += [(e[1], False), (e[2], True)]
+            else:
+                lit = self.literal(e)
+                lits.append(lit if positive else -lit)
+        return lits
+
+    def symbol_model(self):
+        """{symbol: bool} from the solver's last model."""
+        model = self.solver.model
+        return {s: model[v] for s, v in self.variables.items()}
+
+
+def sat_counter_model(KB, query, stats=None):
+    """A model of KB ∧ ¬query as {symbol: bool}, or None if KB entails query."""
+    cnf = CNF(Solver(stats))
+    cnf.add(KB)
+    cnf.add(('not', query))
+    if not cnf.solver.solve():
+        return None
+    return cnf.symbol_model()
+
+def sat_entails(KB, query, stats=None):
+    """True if KB entails query (KB ∧ ¬query is unsatisfiable)."""
+    return sat_counter_model(KB, query, stats) is None
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from .entailment import tt_entails, evaluate
+    from .search_stats import SearchStats
+
+    # pigeonhole: 7 pigeons in 6 holes is unsatisfiable, so the KB entails anything
+    pigeons, holes = 7, 6
+    parts = []
+    for p in range(pigeons):
+        clause = f"P{p}_0"
+        for h in range(1, holes):
+            clause = ('or', clause, f"P{p}_{h}")
+        parts.append(clause)
+    for h in range(holes):
+        for p in range(pigeons):
+            for q in range(p + 1, pigeons):
+                parts.append(('not', ('and', f"P{p}_{h}", f"P{q}_{h}")))
+    kb = parts[0]
+    for part in parts[1:]:
+        kb = ('and', kb, part)
+    started = time.perf_counter()
+    print(f"pigeonhole {pigeons}/{holes} ({pigeons * holes} symbols) entails X:",
+          sat_entails(kb, 'X'), f"in {time.perf_counter() - started:.2f} s")
+
+    # random 3-CNF at the threshold ratio, 1200 clauses chained into one deep
+    # KB, through tt_entails: does it entail a random literal?
+    rng = random.Random(0)
+    n = 300
+    symbols = [f"S{i}" for i in range(n)]
+    def lit():
+        s = rng.choice(symbols)
+        return s if rng.random() < 0.5 else ('not', s)
+    clauses = [('or', lit(), ('or', lit(), lit())) for _ in range(int(4.0 * n))]
+    kb = clauses[0]
+    for clause in clauses[1:]:
+        kb = ('and', kb, clause)
+    stats = SearchStats(tracer=lambda event, data: found.update(data["model"]))
+    found = {}
+    started = time.perf_counter()
+    entailed = tt_entails(kb, 'S0', stats=stats, backend="sat")
+    print(f"random 3-CNF, {n} symbols, {len(clauses)} clauses, entails S0:", entailed,
+          f"in {time.perf_counter() - started:.2f} s", stats)
+    if not entailed:
+        print("counter-model checks out:",
+              all(evaluate(c, found) for c in clauses) and not found['S0'])
+
+    small_kb = ('and', ('or', 'A', 'C'), ('or', 'B', ('not', 'C')))
+    print("example KB entails A or B:", sat_entails(small_kb, ('or', 'A', 'B')),
+          "(truth table:", tt_entails(small_kb, ('or', 'A', 'B')), ")")
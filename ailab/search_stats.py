@@ -0,0 +1,71 @@
+# Search instrumentation shared by the puzzle, game and logic modules
+# - Every instrumented function takes stats=None. With None the only cost is
+#   one "is not None" test per node; pass a SearchStats to collect numbers.
+# - Counters: expanded (nodes/models/steps processed), generated (successors
+#   created), peak_open / peak_closed (largest frontier and closed/visited
+#   sizes), inferences (new facts/clauses derived), cutoffs (alpha-beta
+#   prunes), elapsed seconds and nodes_per_second.
+# - tracer: optional callable(event, data_dict) for per-node events, e.g.
+#   ("expand", {"state": ..., "g": 3, "h": 5}); print_tracer prints them.
+
+import time
+
+# Loops with a deadline (a time.monotonic() timestamp) read the clock only when
+# their step count is a multiple of this, so the check costs next to nothing.
+CLOCK_CHECK_INTERVAL = 256
+
+class SearchStats:
+    def __init__(self, tracer=None):
+        self.tracer = tracer
+        self.expanded = 0
+        self.generated = 0
+        self.peak_open = 0
+        self.peak_closed = 0
+        self.inferences = 0
+        self.cutoffs = 0
+        self.elapsed = 0.0
+        self._started = None
+
+    def start(self):
+        self._started = time.perf_counter()
+
+    def stop(self):
+        if self._started is not None:
+            self.elapsed += time.perf_counter() - self._started
+            self._started = None
+
+    def open_size(self, n):
+        if n > self.peak_open:
+            self.peak_open = n
+
+    def closed_size(self, n):
+        if n > self.peak_closed:
+            self.peak_closed = n
+
+    def trace(self, event, **data):
+        if self.tracer is not None:
+            self.tracer(event, data)
+
+    @property
+    def nodes_per_second(self):
+        return self.expanded / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self):
+        return {
+            "expanded": self.expanded,
+            "generated": self.generated,
+            "peak_open": self.peak_open,
+            "peak_closed": self.peak_closed,
+            "inferences": self.inferences,
+            "cutoffs": self.cutoffs,
+            "elapsed": self.elapsed,
+            "nodes_per_second": self.nodes_per_second,
+        }
+
+    def __repr__(self):
+        return "SearchStats(" + ", ".join(f"{k}={v:.4g}" if isinstance(v, float) else f"{k}={v}"
+                                          for k, v in self.as_dict().items()) + ")"
+
+
+def print_tracer(event, data):
+    print(event, " ".join(f"{k}={v}" for k, v in data.items()))
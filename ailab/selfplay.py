@@ -0,0 +1,241 @@
+# Headless self-play for m,n,k games (k in a row on an m x n board; X moves first)
+# - MNKGame implements abpruning.Game: cells in a bytearray, the empty cells in
+#   a list with O(1) swap-remove, and a win check that only counts outward from
+#   the last move in the four line directions
+# - Strategies: "random", "perfect" (the tic-tac-toe table on 3,3,3, full
+#   alpha-beta with a transposition table elsewhere, which only finishes on
+#   small boards) and "alphabeta:d" (depth-d search; ties broken at random)
+# - simulate() plays the games in shards on a process pool. Every shard gets its
+#   own RNG seeded from (seed, shard index), so results depend only on the seed,
+#   not on the worker count or scheduling
+#
+#   python -m ailab.selfplay --games 1000000 --x random --o perfect
+#   python -m ailab.selfplay -m 4 -n 4 -k 3 --x alphabeta:2 --o random --games 2000
+
+import multiprocessing
+import random
+import time
+
+from .abpruning import Game, TranspositionTable, game_alpha_beta, zobrist_keys
+
+EMPTY, X, O = 0, 1, 2
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+class MNKGame(Game):
+    def __init__(self, m=3, n=3, k=3):
+        if min(m, n) < 1 or not 1 <= k <= max(m, n):
+            raise ValueError("Need m, n >= 1 and 1 <= k <= max(m, n)", (m, n, k))
+        self.m, self.n, self.k = m, n, k
+        self.cells = bytearray(m * n)
+        self.empty = list(range(m * n))
+        self.where = list(range(m * n))  # where[cell] = index of cell in empty
+        self.removed_at = []             # undo stack of indices into empty
+        self.masks = [0, 0, 0]           # per-player bitboards (X, O at 1, 2)
+        self.winner = EMPTY
+        self.max_to_move = True
+        self.zobrist = zobrist_keys(2 * m * n + 1, seed=m * 10007 + n * 101 + k)
+        self.key = 0
+
+    def reset(self):
+        """Back to the empty board (cheaper than undoing every move)."""
+        size = self.m * self.n
+        self.cells = bytearray(size)
+        self.empty = list(range(size))
+        self.where = list(range(size))
+        self.removed_at = []
+        self.masks = [0, 0, 0]
+        self.winner = EMPTY
+        self.max_to_move = True
+        self.key = 0
+
+    def moves(self):
+        return list(self.empty)
+
+    def apply(self, cell):
+        player = X if self.max_to_move else O
+        self.cells[cell] = player
+        self.masks[player] |= 1 << cell
+        # swap-remove cell from the empty list
+        i, last = self.where[cell], self.empty[-1]
+        self.empty[i] = last
+        self.where[last] = i
+        self.empty.pop()
+        self.removed_at.append(i)
+        self.key ^= self.zobrist[2 * cell + player - 1] ^ self.zobrist[-1]
+        self.max_to_move = not self.max_to_move
+        if self._wins(cell, player):
+            self.winner = player
+
+    def undo(self, cell):
+        player = self.cells[cell]
+        self.cells[cell] = EMPTY
+        self.masks[player] &= ~(1 << cell)
+        i = self.removed_at.pop()
+        if i == len(self.empty):
+            self.empty.append(cell)
+        else:
+            moved = self.empty[i]
+            self.empty.append(moved)
+            self.where[moved] = len(self.empty) - 1
+            self.empty[i] = cell
+        self.where[cell] = i
+        self.key ^= self.zobrist[2 * cell + player - 1] ^ self.zobrist[-1]
+        self.max_to_move = not self.max_to_move
+        self.winner = EMPTY  # the game was still running before this move
+
+    def _wins(self, cell, player):
+        m, n, k, cells = self.m, self.n, self.k, self.cells
+        r0, c0 = divmod(cell, n)
+        for dr, dc in DIRECTIONS:
+            count = 1
+            for sign in (1, -1):
+                r, c = r0 + sign * dr, c0 + sign * dc
+                while 0 <= r < m and 0 <= c < n and cells[r * n + c] == player:
+                    count += 1
+                    r += sign * dr
+                    c += sign * dc
+            if count >= k:
+                return True
+        return False
+
+    def is_terminal(self):
+        return self.winner != EMPTY or not self.empty
+
+    def evaluate(self):
+        # faster wins score higher; a running game scores 0
+        if self.winner == X:
+            return 1 + len(self.empty)
+        if self.winner == O:
+            return -1 - len(self.empty)
+        return 0
+
+    def result(self):
+        """+1 X won, -1 O won, 0 draw (or still running)."""
+        return 1 if self.winner == X else -1 if self.winner == O else 0
+
+# -----------------------------
+# Strategies: strategy(game, rng) -> cell
+# -----------------------------
+def random_strategy(game, rng):
+    return game.empty[rng.randrange(len(game.empty))]
+
+def alpha_beta_strategy(depth, table=None):
+    def choose(game, rng):
+        best, best_moves = None, []
+        for cell in game.moves():
+            game.apply(cell)
+            value, _ = game_alpha_beta(game, depth - 1, table=table)
+            game.undo(cell)
+            if not game.max_to_move:
+                value = -value  # O minimizes
+            if best is None or value > best:
+                best, best_moves = value, [cell]
+            elif value == best:
+                best_moves.append(cell)
+        return rng.choice(best_moves)
+    return choose
+
+def perfect_strategy(game):
+    if (game.m, game.n, game.k) == (3, 3, 3):
+        from .tictactoe import best_move
+        return lambda g, rng: best_move(g.masks[X], g.masks[O])
+    return alpha_beta_strategy(game.m * game.n, TranspositionTable(1 << 18))
+
+def make_strategy(name, game):
+    """"random", "perfect" or "alphabeta:d" -> strategy function for this game's shape."""
+    if name == "random":
+        return random_strategy
+    if name == "perfect":
+        return perfect_strategy(game)
+    if name.startswith("alphabeta:"):
+        depth = int(name.split(":", 1)[1])
+        if depth < 1:
+            raise ValueError("Search depth must be at least 1", name)
+        return alpha_beta_strategy(depth, TranspositionTable(1 << 16))
+    raise ValueError("Unknown strategy", name)
+
+# -----------------------------
+# Simulation
+# -----------------------------
+def play_one(game, x_strategy, o_strategy, rng):
+    """Play one game from the empty board (game is reset first). Returns (result, moves)."""
+    game.reset()
+    moves = 0
+    while game.winner == EMPTY and game.empty:
+        game.apply((x_strategy if game.max_to_move else o_strategy)(game, rng))
+        moves += 1
+    return game.result(), moves
+
+def play_shard(task):
+    """Play count games with an RNG seeded from (seed, shard); returns the tallies."""
+    shard, count, seed, (m, n, k), x_name, o_name = task
+    rng = random.Random(seed * 1000003 + shard)
+    game = MNKGame(m, n, k)
+    x_strategy, o_strategy = make_strategy(x_name, game), make_strategy(o_name, game)
+    tally = {1: 0, -1: 0, 0: 0}
+    moves = 0
+    for _ in range(count):
+        result, length = play_one(game, x_strategy, o_strategy, rng)
+        tally[result] += 1
+        moves += length
+    return tally[1], tally[-1], tally[0], moves
+
+def simulate(games, m=3, n=3, k=3, x="random", o="random", workers=None, seed=0, shard_size=1000):
+    """
+    Play games between strategies x and o and return aggregate statistics.
+    workers=None uses every core; workers=0 plays in this process.
+    """
+    MNKGame(m, n, k)  # validate the shape before starting workers
+    tasks = []
+    for shard, start in enumerate(range(0, games, shard_size)):
+        tasks.append((shard, min(shard_size, games - start), seed, (m, n, k), x, o))
+
+    started = time.perf_counter()
+    totals = [0, 0, 0, 0]
+    if workers == 0:
+        for result in map(play_shard, tasks):
+            totals = [a + b for a, b in zip(totals, result)]
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            for result in pool.imap_unordered(play_shard, tasks):
+                totals = [a + b for a, b in zip(totals, result)]
+    elapsed = time.perf_counter() - started
+
+    x_wins, o_wins, draws, moves = totals
+    return {
+        "board": [m, n, k],
+        "x": x,
+        "o": o,
+        "games": games,
+        "x_wins": x_wins,
+        "o_wins": o_wins,
+        "draws": draws,
+        "x_win_rate": x_wins / games if games else 0.0,
+        "o_win_rate": o_wins / games if games else 0.0,
+        "draw_rate": draws / games if games else 0.0,
+        "mean_length": moves / games if games else 0.0,
+        "seed": seed,
+        "elapsed": elapsed,
+        "games_per_second": games / elapsed if elapsed else 0.0,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Headless m,n,k self-play.")
+    parser.add_argument("-m", type=int, default=3, help="rows")
+    parser.add_argument("-n", type=int, default=3, help="columns")
+    parser.add_argument("-k", type=int, default=3, help="in a row to win")
+    parser.add_argument("--x", default="random", help="random, perfect or alphabeta:d")
+    parser.add_argument("--o", default="random", help="random, perfect or alphabeta:d")
+    parser.add_argument("--games", type=int, default=100000)
+    parser.add_argument("--workers", type=int, help="worker processes (0 = in-process)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--shard-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    stats = simulate(args.games, args.m, args.n, args.k, args.x, args.o,
+                     args.workers, args.seed, args.shard_size)
+    print(json.dumps(stats, indent=2))
@@ -0,0 +1,192 @@
+# Solution cache for N-puzzle queries: in-memory LRU in front of a sqlite file
+# - Keys are canonical states. The only board symmetry that keeps the standard
+#   goal fixed is the main-diagonal reflection (transpose) with tiles relabeled
+#   by their transposed goal cell; it swaps the blank's moves up<->left and
+#   down<->right. A state and its mirror share one entry under the smaller key.
+# - Values are move strings ("u", "d", "l", "r" per move), stored for the
+#   canonical state and mirrored back on lookup
+# - Storing an optimal solution also stores its suffixes: every state on an
+#   optimal path has the rest of that path as an optimal solution
+# - Counters: hits (memory), disk_hits (sqlite), misses, evictions (LRU)
+# - Entries evicted from memory stay on disk; the sqlite file survives restarts
+
+import sqlite3
+from collections import OrderedDict
+
+from .puzzle_state import spec, pack, to_lists, path_moves, follow_moves
+
+MOVE_LETTERS = {"up": "u", "down": "d", "left": "l", "right": "r"}
+LETTER_MOVES = {v: k for k, v in MOVE_LETTERS.items()}
+MIRRORED = str.maketrans("udlr", "lrud")
+
+_mirrors = {}
+
+def _mirror_tables(width):
+    """(cell map, tile map) for the transpose that keeps the standard goal fixed."""
+    tables = _mirrors.get(width)
+    if tables is None:
+        size = width * width
+        cell_map = [(i % width) * width + i // width for i in range(size)]
+        # tile t sits at goal cell t-1; its image is the tile whose goal cell is the transposed one
+        tile_map = [0] + [cell_map[t - 1] + 1 for t in range(1, size)]
+        tables = _mirrors[width] = (cell_map, tile_map)
+    return tables
+
+def mirror(state, width=3):
+    """Transpose a packed state and relabel its tiles (an involution)."""
+    s = spec(width)
+    cell_map, tile_map = _mirror_tables(width)
+    bits, tile_mask = s.bits, s.tile_mask
+    result = 0
+    for cell in range(s.size):
+        result |= tile_map[(state >> (bits * cell)) & tile_mask] << (bits * cell_map[cell])
+    return result | (cell_map[state >> s.blank_shift] << s.blank_shift)
+
+def canonical(state, width=3):
+    """(key, mirrored): the smaller of state and its mirror, and whether it is the mirror."""
+    other = mirror(state, width)
+    return (other, True) if other < state else (state, False)
+
+
+class SolutionCache:
+    def __init__(self, capacity=100000, path=None, width=3):
+        self.capacity = capacity
+        self.width = width
+        self.entries = OrderedDict()  # canonical state -> move letters
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.db = None
+        if path is not None:
+            self.db = sqlite3.connect(path)
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("PRAGMA synchronous=NORMAL")
+            self.db.execute("CREATE TABLE IF NOT EXISTS solutions "
+                            "(width INTEGER, state TEXT, moves TEXT, PRIMARY KEY (width, state))")
+            self.db.commit()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+    def _remember(self, key, letters):
+        self.entries[key] = letters
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, state):
+        """Move names solving packed state, or None if it is not cached."""
+        key, mirrored = canonical(state, self.width)
+        letters = self.entries.get(key)
+        if letters is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+        elif self.db is not None:
+            row = self.db.execute("SELECT moves FROM solutions WHERE width = ? AND state = ?",
+                                  (self.width, format(key, "x"))).fetchone()
+            if row is not None:
+                letters = row[0]
+                self._remember(key, letters)
+                self.disk_hits += 1
+        if letters is None:
+            self.misses += 1
+            return None
+        if mirrored:
+            letters = letters.translate(MIRRORED)
+        return [LETTER_MOVES[c] for c in letters]
+
+    def put(self, path, optimal=True):
+        """
+        Cache the solution given as the packed states from start to goal. With
+        optimal=True every state on the path is cached with its suffix.
+        """
+        letters = "".join(MOVE_LETTERS[m] for m in path_moves(path, self.width))
+        rows = []
+        for i, state in enumerate(path if optimal else path[:1]):
+            key, mirrored = canonical(state, self.width)
+            suffix = letters[i:].translate(MIRRORED) if mirrored else letters[i:]
+            if key not in self.entries:
+                rows.append((self.width, format(key, "x"), suffix))
+            self._remember(key, suffix)
+        if self.db is not None and rows:
+            self.db.executemany("INSERT OR REPLACE INTO solutions VALUES (?, ?, ?)", rows)
+            self.db.commit()
+
+    def counters(self):
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self.entries),
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+        }
+
+
+def cached_solve(start_state, cache, solver=None):
+    """
+    Optimal solution path (list of boards) for start_state, answered from the
+    cache when possible. solver(board) must return an optimal path of boards
+    or None (default: a_star with Manhattan distance); its results are cached.
+    Unsolvable boards raise ValueError as the solvers do, and so do boards
+    whose size differs from cache.width.
+    """
+    width = len(start_state)
+    if width != cache.width:
+        raise ValueError("Board size does not match the cache width", width, cache.width)
+    start = pack(start_state)
+    moves = cache.get(start)
+    if moves is not None:
+        return [to_lists(state, width) for state in follow_moves(start, moves, width)]
+    if solver is None:
+        from .a_star import a_star as solver
+    path = solver(start_state)
+    if path is not None:
+        cache.put([pack(board) for board in path])
+    return path
+
+
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+    import time
+
+    from .puzzle_state import is_solvable
+
+    rng = random.Random(1)
+    boards = []
+    while len(boards) < 40:
+        tiles = list(range(9))
+        rng.shuffle(tiles)
+        board = [tiles[r * 3:r * 3 + 3] for r in range(3)]
+        if is_solvable(board):
+            boards.append(board)
+    queries = [rng.choice(boards) for _ in range(400)]  # repeated traffic
+
+    path = os.path.join(tempfile.mkdtemp(), "solutions.sqlite")
+    with SolutionCache(capacity=5000, path=path) as cache:
+        started = time.perf_counter()
+        for board in queries:
+            cached_solve(board, cache)
+        print(f"cold: {time.perf_counter() - started:.2f} s", cache.counters())
+
+    with SolutionCache(capacity=5000, path=path) as cache:  # reopened: served from disk
+        started = time.perf_counter()
+        for board in queries:
+            cached_solve(board, cache)
+        print(f"warm: {time.perf_counter() - started:.2f} s", cache.counters())
@@ -0,0 +1,53 @@
+# On-disk lookup tables (8-puzzle distances, pattern databases, tic-tac-toe)
+# - Tables live in table_dir(): the directory given to set_table_dir, else
+#   $AILAB_TABLE_DIR, else the package directory (which may be read-only, so
+#   deployments should point one of the first two somewhere writable)
+# - write_table writes to a private temp file next to the target and renames
+#   it into place, so processes that build the same table at once (pool
+#   workers starting together) never write into each other's file, and a
+#   reader only ever sees a complete table
+# - map_table builds a missing or wrong-sized table, then checks the size of
+#   the file it actually opened before memory-mapping it
+
+import mmap
+import os
+import tempfile
+
+TABLE_DIR_ENV = "AILAB_TABLE_DIR"
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+_directory = None
+
+def set_table_dir(directory):
+    """Use directory for tables from now on (None restores the default)."""
+    global _directory
+    _directory = directory
+
+def table_dir():
+    return _directory or os.environ.get(TABLE_DIR_ENV) or HERE
+
+def table_path(name, directory=None):
+    return os.path.join(directory or table_dir(), name)
+
+def write_table(data, path):
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)  # never leave a half-written table behind
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+def map_table(path, size, build):
+    """Memory-map the size-byte table at path, writing build() there first if needed."""
+    if not os.path.exists(path) or os.path.getsize(path) != size:
+        write_table(build(), path)
+    with open(path, "rb") as f:
+        actual = os.fstat(f.fileno()).st_size
+        if actual != size:
+            raise ValueError("Table file has the wrong size", path, actual)
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
@@ -0,0 +1,207 @@
+# Tic-tac-toe: the interactive game on a list-of-lists board, plus
+# - Bitboards: a position is two 9-bit masks (x, o), cell r*3+c is bit r*3+c;
+#   WINNING[mask] says whether a mask holds a full row, column or diagonal
+# - A perfect-play table over every 18-bit (x, o) pair: one byte per position,
+#   outcome << 4 | best cell (NO_MOVE once the game is over), 0 for positions
+#   that cannot occur. It is solved once by minimax over the 5,478 legal
+#   positions (X moves first), saved in the table directory (table_files.py)
+#   and memory-mapped, so choosing a move is one lookup
+# - The computer (O) plays from the table
+
+import random
+
+from .abpruning import Game, zobrist_keys
+from .table_files import map_table, table_path, write_table
+
+WIN_MASKS = (0b000000111, 0b000111000, 0b111000000,   # rows
+             0b001001001, 0b010010010, 0b100100100,   # columns
+             0b100010001, 0b001010100)                # diagonals
+FULL = 0b111111111
+WINNING = bytes(any(m & w == w for w in WIN_MASKS) for m in range(1 << 9))
+
+DRAW, X_WINS, O_WINS = 1, 2, 3
+NO_MOVE = 0xF
+TABLE_SIZE = 1 << 18
+FILE_NAME = "tictactoe_table.bin"
+
+def print_board(board):
+    # Print the board rows with separators
+    for row in board:
+        print(" | ".join(row))
+        print("-" * 9) # Separator line between rows
+
+
+def is_board_full(board):
+    return all(cell != " " for row in board for cell in row)
+
+# Function to handle the player's move
+def player_move(board):
+    """Handles the player's input for their move and updates the board."""
+    while True:
+        try:
+            row = int(input("Enter row (0, 1, 2): "))
+            col = int(input("Enter column (0, 1, 2): "))
+            if 0 <= row < 3 and 0 <= col < 3 and board[row][col] == " ":
+                board[row][col] = "X" # Place player's mark
+                break # Exit the loop after a valid move
+            else:
+                print("Invalid move. Try again.")
+        except ValueError:
+            print("Invalid input. Please enter numbers.")
+
+
+def computer_move(board, perfect=True):
+    """Place an "O": the table's best move, or a random empty cell."""
+    if perfect:
+        cell = best_move(board_mask(board, "X"), board_mask(board, "O"))
+    else:
+        cell = random.choice([i for i in range(9) if board[i // 3][i % 3] == " "])
+    board[cell // 3][cell % 3] = "O"
+
+def board_mask(board, player):
+    mask = 0
+    for r in range(3):
+        for c in range(3):
+            if board[r][c] == player:
+                mask |= 1 << (r * 3 + c)
+    return mask
+
+def check_hardcoded_win(board, player):
+    return WINNING[board_mask(board, player)] == 1
+
+# -----------------------------
+# Perfect-play table
+# -----------------------------
+def solve_table():
+    """Minimax over all positions reachable from the empty board; returns a bytearray."""
+    table = bytearray(TABLE_SIZE)
+    score = {}  # index -> 10 - plies to an X win, 0 draw, plies - 10 to an O win
+
+    def solve(x, o):
+        index = x << 9 | o
+        if index in score:
+            return score[index]
+        if WINNING[x] or WINNING[o] or x | o == FULL:
+            value = 10 if WINNING[x] else -10 if WINNING[o] else 0
+            table[index] = (X_WINS if value > 0 else O_WINS if value < 0 else DRAW) << 4 | NO_MOVE
+            score[index] = value
+            return value
+        x_to_move = x.bit_count() == o.bit_count()
+        best, best_cell = None, None
+        for cell in range(9):
+            bit = 1 << cell
+            if (x | o) & bit:
+                continue
+            value = solve(x | bit, o) if x_to_move else solve(x, o | bit)
+            value -= (value > 0) - (value < 0)  # a win one ply later is worth a little less
+            if best is None or (value > best if x_to_move else value < best):
+                best, best_cell = value, cell
+        table[index] = (X_WINS if best > 0 else O_WINS if best < 0 else DRAW) << 4 | best_cell
+        score[index] = best
+        return best
+
+    solve(0, 0)
+    return table
+
+def save_table(table, path=None):
+    write_table(table, path or table_path(FILE_NAME))
+
+def load_table(path=None):
+    """Memory-map the table at path (default: in table_files.table_dir()), solving it first if missing."""
+    return map_table(path or table_path(FILE_NAME), TABLE_SIZE, solve_table)
+
+_table = None
+
+def get_table():
+    global _table
+    if _table is None:
+        _table = load_table()
+    return _table
+
+def best_move(x, o):
+    """Best cell (0-8) for the side to move, or None if the game is over."""
+    entry = get_table()[x << 9 | o]
+    if entry == 0:
+        raise ValueError("Position cannot occur in a game", (x, o))
+    cell = entry & 0xF
+    return None if cell == NO_MOVE else cell
+
+def outcome(x, o):
+    """DRAW, X_WINS or O_WINS under perfect play from this position."""
+    entry = get_table()[x << 9 | o]
+    if entry == 0:
+        raise ValueError("Position cannot occur in a game", (x, o))
+    return entry >> 4
+
+
+# Game-interface adapter (see abpruning.Game) over the same list-of-lists board.
+# X maximizes; a finished game scores +1 (X wins), -1 (O wins) or 0 (draw).
+ZOBRIST = zobrist_keys(19, seed=3)  # (cell, player) pairs, then the side to move
+PIECE_INDEX = {"X": 0, "O": 1}
+
+class TicTacToe(Game):
+    def __init__(self, board=None, to_move="X"):
+        self.board = board if board is not None else [[" "] * 3 for _ in range(3)]
+        self.max_to_move = to_move == "X"
+        self.key = 0 if self.max_to_move else ZOBRIST[18]
+        for r in range(3):
+            for c in range(3):
+                if self.board[r][c] != " ":
+                    self.key ^= ZOBRIST[2 * (r * 3 + c) + PIECE_INDEX[self.board[r][c]]]
+
+    def moves(self):
+        return [(r, c) for r in range(3) for c in range(3) if self.board[r][c] == " "]
+
+    def apply(self, move):
+        r, c = move
+        player = "X" if self.max_to_move else "O"
+        self.board[r][c] = player
+        self.key ^= ZOBRIST[2 * (r * 3 + c) + PIECE_INDEX[player]] ^ ZOBRIST[18]
+        self.max_to_move = not self.max_to_move
+
+    def undo(self, move):
+        r, c = move
+        player = self.board[r][c]
+        self.board[r][c] = " "
+        self.key ^= ZOBRIST[2 * (r * 3 + c) + PIECE_INDEX[player]] ^ ZOBRIST[18]
+        self.max_to_move = not self.max_to_move
+
+    def is_terminal(self):
+        return (check_hardcoded_win(self.board, "X") or check_hardcoded_win(self.board, "O")
+                or is_board_full(self.board))
+
+    def evaluate(self):
+        if check_hardcoded_win(self.board, "X"):
+            return 1
+        if check_hardcoded_win(self.board, "O"):
+            return -1
+        return 0
+
+
+def play_game():
+    board = [[" " for _ in range(3)] for _ in range(3)]
+    print("Welcome to Tic Tac Toe!")
+    print_board(board)
+
+    while True:
+        player_move(board)
+        print_board(board)
+        if check_hardcoded_win(board, "X"):
+            print("Congratulations! You win!")
+            break
+        if is_board_full(board):
+            print("It's a draw!")
+            break
+
+        computer_move(board)
+        print("Computer's move:")
+        print_board(board)
+        if check_hardcoded_win(board, "O"):
+            print("Computer wins!")
+            break
+        if is_board_full(board):
+            print("It's a draw!")
+            break
+
+if __name__ == "__main__":
+    play_game()